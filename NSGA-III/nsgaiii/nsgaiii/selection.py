@@ -16,6 +16,7 @@
 #    by Luis Marti http://lmarti.com
 
 import copy
+import functools
 import random
 
 import numpy as np
@@ -32,16 +33,15 @@ class ReferencePoint(list):
         self.associations = []
 
 
-def generate_reference_points(num_objs, num_divisions_per_obj=4):
-    """Generates reference points for NSGA-III selection. This code is based on
-    jMetal NSGA-III implementation <https://github.com/jMetal/jMetal>.
-    """
+@functools.lru_cache(maxsize=16)
+def _reference_point_coordinates(num_objs, num_divisions_per_obj):
+    """Runs the Das-Dennis recursion once per (num_objs, divisions) pair and
+    caches the immutable coordinate tuples."""
 
     def gen_refs_recursive(work_point, num_objs, left, total, depth):
         if depth == num_objs - 1:
             work_point[depth] = left / total
-            ref = ReferencePoint(copy.deepcopy(work_point))
-            return [ref]
+            return [tuple(work_point)]
         else:
             res = []
             for i in range(left):
@@ -60,6 +60,19 @@ def generate_reference_points(num_objs, num_divisions_per_obj=4):
     )
 
 
+def generate_reference_points(num_objs, num_divisions_per_obj=4):
+    """Generates reference points for NSGA-III selection. This code is based on
+    jMetal NSGA-III implementation <https://github.com/jMetal/jMetal>.
+
+    The lattice coordinates are memoized; only the mutable ReferencePoint
+    wrappers (association state) are rebuilt per call.
+    """
+    return [
+        ReferencePoint(coords)
+        for coords in _reference_point_coordinates(num_objs, num_divisions_per_obj)
+    ]
+
+
 def find_ideal_point(individuals):
     "Finds the ideal point from a set individuals."
     current_ideal = [np.infty] * len(individuals[0].fitness.values)
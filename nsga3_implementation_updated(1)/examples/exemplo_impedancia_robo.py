@@ -7,9 +7,11 @@ de otimização de impedância para interação física humano-robô com o NSGA-
 
 import os
 import sys
+from pathlib import Path
 import numpy as np
 import matplotlib.pyplot as plt
 from mpl_toolkits.mplot3d import Axes3D
+from concurrent.futures import ProcessPoolExecutor
 
 # Adicionar diretórios ao path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -17,6 +19,104 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from nsga3_project.problems.dtlz import Problem
 from nsga3_project.src.nsga3 import NSGA3
 
+try:
+    from numba import njit, prange
+    _NUMBA_AVAILABLE = True
+except ImportError:
+    # Numba é opcional: sem ele, o kernel roda como função Python pura
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        def decorator(func):
+            return func
+        return decorator
+    prange = range
+    _NUMBA_AVAILABLE = False
+
+
+@njit(cache=True, fastmath=True)
+def _simulate_kernel(K, D, M, trajectory, F_ext_arr, dt):
+    """
+    Kernel numérico da simulação de impedância, compilado com Numba quando disponível.
+
+    Args:
+        K, D, M: Vetores de rigidez, amortecimento e inércia (comprimento n_joints)
+        trajectory: Trajetória desejada (shape: [n_steps, n_joints])
+        F_ext_arr: Força externa pré-computada por passo de tempo (comprimento n_steps)
+        dt: Passo de tempo (s)
+
+    Returns:
+        Tupla (mean_error, mean_force, total_energy)
+    """
+    n_steps, n_joints = trajectory.shape
+
+    # Apenas o estado do passo anterior é necessário: manter vetores de
+    # comprimento n_joints e acumuladores escalares das métricas mantém o
+    # laço inteiro em cache, sem alocar matrizes (n_steps, n_joints)
+    position = trajectory[0].copy()
+    velocity = np.zeros(n_joints, dtype=trajectory.dtype)
+
+    err_sum = 0.0
+    force_sum = 0.0
+    energy_sum = 0.0
+
+    for t in range(1, n_steps):
+        # Modelo de impedância: M*a + D*v + K*x = F_ext
+        F_ext = F_ext_arr[t]
+
+        for j in range(n_joints):
+            error = trajectory[t, j] - position[j]
+            acc = (F_ext - D[j] * velocity[j] - K[j] * error) / M[j]
+            velocity[j] = velocity[j] + acc * dt
+            position[j] = position[j] + velocity[j] * dt
+
+            err_sum += abs(trajectory[t, j] - position[j])
+            force_sum += abs(K[j] * error + D[j] * velocity[j])
+            energy_sum += 0.5 * K[j] * error**2 + 0.5 * M[j] * velocity[j]**2
+
+        # Indivíduos instáveis divergem exponencialmente: detectar cedo e
+        # devolver objetivos infinitos em vez de simular os 1000 passos —
+        # a ordenação por dominância trata inf como pior caso possível
+        if t % 64 == 0:
+            for j in range(n_joints):
+                if abs(position[j]) > 1e6:
+                    return np.inf, np.inf, np.inf
+
+    n_samples = n_steps * n_joints
+    mean_error = err_sum / n_samples
+    mean_force = force_sum / n_samples
+    total_energy = energy_sum
+
+    return mean_error, mean_force, total_energy
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def _simulate_batch(K, D, M, trajectory, F_ext_arr, dt):
+    """
+    Simula um lote de indivíduos em paralelo com threads Numba (prange).
+
+    Os indivíduos não compartilham estado, então o laço externo é
+    paralelizado por threads sem o custo de pickling de multiprocessing.
+
+    Args:
+        K, D, M: Matrizes de parâmetros de impedância (shape: [n_pop, n_joints])
+        trajectory: Trajetória desejada (shape: [n_steps, n_joints])
+        F_ext_arr: Força externa pré-computada (comprimento n_steps)
+        dt: Passo de tempo (s)
+
+    Returns:
+        Matriz de objetivos (shape: [n_pop, 3])
+    """
+    n_pop = K.shape[0]
+    F = np.empty((n_pop, 3))
+
+    for i in prange(n_pop):
+        F[i, 0], F[i, 1], F[i, 2] = _simulate_kernel(K[i], D[i], M[i],
+                                                     trajectory, F_ext_arr, dt)
+
+    return F
+
+
 class ImpedanciaRobo(Problem):
     """
     Problema de otimização multiobjetivo para adaptação de impedância em interação física humano-robô.
@@ -42,28 +142,40 @@ class ImpedanciaRobo(Problem):
         super().__init__(n_var, n_obj)
         
         # Definir limites das variáveis
-        # Exemplo: limites para rigidez, amortecimento, inércia e outros parâmetros
-        self.bounds = []
-        
+        # Exemplo: limites para rigidez, amortecimento, inércia e outros
+        # parâmetros. A lista é montada localmente e atribuída uma única vez:
+        # o setter de bounds a converte para os arrays lb/ub
+        bounds = []
+
         # Parâmetros de rigidez (K) para diferentes articulações
         for i in range(3):
-            self.bounds.append((10.0, 1000.0))  # Rigidez (N/m ou Nm/rad)
-        
+            bounds.append((10.0, 1000.0))  # Rigidez (N/m ou Nm/rad)
+
         # Parâmetros de amortecimento (D) para diferentes articulações
         for i in range(3):
-            self.bounds.append((1.0, 100.0))    # Amortecimento (Ns/m ou Nms/rad)
-        
+            bounds.append((1.0, 100.0))    # Amortecimento (Ns/m ou Nms/rad)
+
         # Parâmetros de inércia (M) para diferentes articulações
         for i in range(3):
-            self.bounds.append((0.1, 10.0))     # Inércia (kg ou kgm²)
-        
+            bounds.append((0.1, 10.0))     # Inércia (kg ou kgm²)
+
         # Parâmetro adicional (se n_var > 9)
         for i in range(9, n_var):
-            self.bounds.append((0.0, 1.0))
+            bounds.append((0.0, 1.0))
+
+        self.bounds = bounds
         
         # Parâmetros do modelo de simulação
         self.simulation_steps = 1000
         self.dt = 0.01  # Passo de tempo (s)
+
+        # A trajetória desejada e a força externa não dependem de x, então são
+        # pré-computadas uma única vez aqui em vez de a cada evaluate()
+        # float32: metade da banda de memória e o dobro de lanes SIMD; a
+        # precisão é mais que suficiente para este simulador didático
+        t = np.arange(self.simulation_steps) * self.dt
+        self._trajectory = np.sin(np.outer(t, np.arange(1, 4))).astype(np.float32)
+        self._F_ext = (np.sin(t) * 10.0).astype(np.float32)
         
     def simulate_robot_interaction(self, K, D, M, trajectory):
         """
@@ -83,49 +195,16 @@ class ImpedanciaRobo(Problem):
         # Implementação simplificada da simulação
         # Em um caso real, isso seria substituído por um modelo mais complexo
         # ou por dados experimentais
-        
-        n_joints = len(K)
-        n_steps = len(trajectory)
-        
-        # Inicializar variáveis
-        position = np.zeros((n_steps, n_joints))
-        velocity = np.zeros((n_steps, n_joints))
-        acceleration = np.zeros((n_steps, n_joints))
-        force = np.zeros((n_steps, n_joints))
-        energy = np.zeros((n_steps, n_joints))
-        
-        # Condições iniciais
-        position[0] = trajectory[0]
-        
-        # Simulação
-        for t in range(1, n_steps):
-            for j in range(n_joints):
-                # Modelo de impedância: M*a + D*v + K*x = F_ext
-                # Aqui, simplificamos assumindo uma força externa constante
-                F_ext = np.sin(t * self.dt) * 10.0  # Força externa simulada
-                
-                # Calcular erro de posição
-                error = trajectory[t, j] - position[t-1, j]
-                
-                # Calcular aceleração baseada no modelo de impedância
-                acceleration[t, j] = (F_ext - D[j] * velocity[t-1, j] - K[j] * error) / M[j]
-                
-                # Integrar para obter velocidade e posição
-                velocity[t, j] = velocity[t-1, j] + acceleration[t, j] * self.dt
-                position[t, j] = position[t-1, j] + velocity[t, j] * self.dt
-                
-                # Calcular força de interação
-                force[t, j] = K[j] * error + D[j] * velocity[t, j]
-                
-                # Calcular energia de controle
-                energy[t, j] = 0.5 * K[j] * error**2 + 0.5 * M[j] * velocity[t, j]**2
-        
-        # Calcular métricas
-        mean_error = np.mean(np.abs(trajectory - position))
-        mean_force = np.mean(np.abs(force))
-        total_energy = np.sum(energy)
-        
-        return mean_error, mean_force, total_energy
+
+        # Encaminhar para o kernel compilado (Numba, quando disponível)
+        return _simulate_kernel(
+            np.ascontiguousarray(K, dtype=np.float32),
+            np.ascontiguousarray(D, dtype=np.float32),
+            np.ascontiguousarray(M, dtype=np.float32),
+            np.ascontiguousarray(trajectory, dtype=np.float32),
+            self._F_ext,
+            np.float32(self.dt),
+        )
     
     def evaluate(self, x):
         """
@@ -142,26 +221,100 @@ class ImpedanciaRobo(Problem):
         D = x[3:6]  # Amortecimento
         M = x[6:9]  # Inércia
         
-        # Gerar trajetória desejada para simulação
-        n_joints = 3
-        trajectory = np.zeros((self.simulation_steps, n_joints))
-        
-        # Trajetória senoidal simples para demonstração
-        for t in range(self.simulation_steps):
-            for j in range(n_joints):
-                trajectory[t, j] = np.sin(t * self.dt * (j + 1))
-        
-        # Simular interação robô-humano
-        error, force, energy = self.simulate_robot_interaction(K, D, M, trajectory)
+        # Simular interação robô-humano com a trajetória senoidal pré-computada
+        error, force, energy = self.simulate_robot_interaction(K, D, M, self._trajectory)
         
         # Definir objetivos (todos para minimização)
-        f = np.zeros(self.n_obj)
+        # np.empty: todas as posições são escritas logo em seguida
+        f = np.empty(self.n_obj)
         f[0] = error      # Minimizar erro de trajetória (estabilidade)
         f[1] = force      # Minimizar força de interação (conforto)
         f[2] = energy     # Minimizar energia de controle (esforço)
-        
+
         return f
 
+    def evaluate_batch(self, X):
+        """
+        Avalia uma população inteira em paralelo com múltiplos processos.
+
+        Cada avaliação é independente (padrão mestre-trabalhador), então o
+        lote é distribuído entre os núcleos disponíveis. O problema é
+        picklável porque a trajetória pré-computada é um ndarray simples.
+
+        Args:
+            X: Matriz de variáveis de decisão (shape: [n_pop, n_var])
+
+        Returns:
+            Matriz de valores dos objetivos (shape: [n_pop, n_obj])
+        """
+        n_workers = os.cpu_count() or 1
+        if n_workers == 1 or len(X) < 2 * n_workers:
+            # Lote pequeno: o custo de criar processos não compensa
+            return super().evaluate_batch(X)
+
+        with ProcessPoolExecutor(max_workers=n_workers) as executor:
+            chunksize = max(1, len(X) // (4 * n_workers))
+            return np.vstack(list(executor.map(self.evaluate, X, chunksize=chunksize)))
+
+    def evaluate_population(self, X):
+        """
+        Avalia toda a população como uma única simulação em lote.
+
+        Todos os N indivíduos integram a mesma EDO com parâmetros (K, D, M)
+        diferentes, então o laço temporal é compartilhado e cada passo opera
+        sobre matrizes (N, n_joints) em vez de chamar a simulação N vezes.
+        Apenas o estado do último passo é mantido (estado rolante), junto com
+        acumuladores escalares por indivíduo para as métricas.
+
+        Args:
+            X: Matriz de variáveis de decisão (shape: [n_pop, n_var])
+
+        Returns:
+            Matriz de valores dos objetivos (shape: [n_pop, n_obj])
+        """
+        X = np.ascontiguousarray(X, dtype=np.float32)
+        K = np.ascontiguousarray(X[:, 0:3])
+        D = np.ascontiguousarray(X[:, 3:6])
+        M = np.ascontiguousarray(X[:, 6:9])
+
+        if _NUMBA_AVAILABLE:
+            # Kernel paralelo: um indivíduo por thread, sem custo de fork
+            return _simulate_batch(K, D, M, self._trajectory, self._F_ext,
+                                   np.float32(self.dt))
+
+        traj = self._trajectory
+        F_ext = self._F_ext
+        dt = self.dt
+        n_steps, n_joints = traj.shape
+        n_pop = X.shape[0]
+
+        # Estado rolante em float32: somente o último passo é necessário
+        pos = np.tile(traj[0], (n_pop, 1))
+        vel = np.zeros((n_pop, n_joints), dtype=np.float32)
+
+        err_sum = np.zeros(n_pop)
+        force_sum = np.zeros(n_pop)
+        energy_sum = np.zeros(n_pop)
+
+        for t in range(1, n_steps):
+            err = traj[t] - pos
+            acc = (F_ext[t] - D * vel - K * err) / M
+            vel = vel + acc * dt
+            pos = pos + vel * dt
+            force = K * err + D * vel
+            energy = 0.5 * K * err**2 + 0.5 * M * vel**2
+
+            err_sum += np.abs(traj[t] - pos).sum(axis=1)
+            force_sum += np.abs(force).sum(axis=1)
+            energy_sum += energy.sum(axis=1)
+
+        n_samples = n_steps * n_joints
+        F = np.empty((n_pop, self.n_obj))
+        F[:, 0] = err_sum / n_samples
+        F[:, 1] = force_sum / n_samples
+        F[:, 2] = energy_sum
+        return F
+
 def run_impedancia_example():
     """
     Executa o exemplo de otimização de impedância com NSGA-III.
@@ -184,9 +337,10 @@ def run_impedancia_example():
     fig = plt.figure(figsize=(10, 8))
     ax = fig.add_subplot(111, projection='3d')
     
-    # Plotar pontos
-    scatter = ax.scatter(objectives[:, 0], objectives[:, 1], objectives[:, 2], 
-                         c=np.sum(objectives, axis=1), cmap='viridis', s=30)
+    # Plotar pontos (soma dos objetivos calculada uma única vez)
+    obj_sum = objectives.sum(axis=1)
+    scatter = ax.scatter(objectives[:, 0], objectives[:, 1], objectives[:, 2],
+                         c=obj_sum, cmap='viridis', s=30)
     
     # Adicionar barra de cores
     cbar = plt.colorbar(scatter)
@@ -209,8 +363,13 @@ def run_impedancia_example():
     
     # Selecionar uma solução de compromisso
     # Método simples: normalizar objetivos e escolher a solução com menor soma
-    normalized_obj = (objectives - np.min(objectives, axis=0)) / (np.max(objectives, axis=0) - np.min(objectives, axis=0))
-    compromise_idx = np.argmin(np.sum(normalized_obj, axis=1))
+    # np.ptp faz min/max em uma única passada; amplitude zero vira 1 para
+    # evitar divisão por zero quando um objetivo é constante
+    omin = objectives.min(axis=0)
+    orange = np.ptp(objectives, axis=0)
+    orange[orange == 0] = 1.0
+    normalized_obj = (objectives - omin) / orange
+    compromise_idx = int(normalized_obj.sum(axis=1).argmin())
     
     print("\nSolução de compromisso selecionada:")
     print(f"Parâmetros de Rigidez (K): {population[compromise_idx, 0:3]}")
@@ -218,27 +377,35 @@ def run_impedancia_example():
     print(f"Parâmetros de Inércia (M): {population[compromise_idx, 6:9]}")
     print(f"Valores dos objetivos: {objectives[compromise_idx]}")
     
-    # Salvar resultados em arquivo
+    # Salvar resultados em arquivo: o relatório inteiro é montado em uma
+    # lista de linhas e gravado com uma única escrita
     results_file = os.path.join(output_dir, 'resultados_impedancia.md')
-    with open(results_file, 'w') as f:
-        f.write("# Resultados da Otimização de Impedância\n\n")
-        f.write("## Estatísticas das Soluções\n\n")
-        f.write(f"Número de soluções não-dominadas: {len(objectives)}\n")
-        f.write(f"Mínimo Erro de Trajetória: {np.min(objectives[:, 0]):.6f}\n")
-        f.write(f"Mínimo Força de Interação: {np.min(objectives[:, 1]):.6f}\n")
-        f.write(f"Mínimo Energia de Controle: {np.min(objectives[:, 2]):.6f}\n\n")
-        
-        f.write("## Solução de Compromisso\n\n")
-        f.write(f"Parâmetros de Rigidez (K): {population[compromise_idx, 0:3]}\n")
-        f.write(f"Parâmetros de Amortecimento (D): {population[compromise_idx, 3:6]}\n")
-        f.write(f"Parâmetros de Inércia (M): {population[compromise_idx, 6:9]}\n")
-        f.write(f"Valores dos objetivos: {objectives[compromise_idx]}\n\n")
-        
-        f.write("## Todas as Soluções Não-Dominadas\n\n")
-        f.write("| Índice | Erro de Trajetória | Força de Interação | Energia de Controle |\n")
-        f.write("|--------|-------------------|--------------------|--------------------|")
-        for i in range(min(20, len(objectives))):  # Limitar a 20 soluções para legibilidade
-            f.write(f"\n| {i} | {objectives[i, 0]:.6f} | {objectives[i, 1]:.6f} | {objectives[i, 2]:.6f} |")
+    parts = [
+        "# Resultados da Otimização de Impedância",
+        "",
+        "## Estatísticas das Soluções",
+        "",
+        f"Número de soluções não-dominadas: {len(objectives)}",
+        f"Mínimo Erro de Trajetória: {np.min(objectives[:, 0]):.6f}",
+        f"Mínimo Força de Interação: {np.min(objectives[:, 1]):.6f}",
+        f"Mínimo Energia de Controle: {np.min(objectives[:, 2]):.6f}",
+        "",
+        "## Solução de Compromisso",
+        "",
+        f"Parâmetros de Rigidez (K): {population[compromise_idx, 0:3]}",
+        f"Parâmetros de Amortecimento (D): {population[compromise_idx, 3:6]}",
+        f"Parâmetros de Inércia (M): {population[compromise_idx, 6:9]}",
+        f"Valores dos objetivos: {objectives[compromise_idx]}",
+        "",
+        "## Todas as Soluções Não-Dominadas",
+        "",
+        "| Índice | Erro de Trajetória | Força de Interação | Energia de Controle |",
+        "|--------|-------------------|--------------------|--------------------|",
+    ]
+    # Limitar a 20 soluções para legibilidade
+    parts.extend(f"| {i} | {objectives[i, 0]:.6f} | {objectives[i, 1]:.6f} | {objectives[i, 2]:.6f} |"
+                 for i in range(min(20, len(objectives))))
+    Path(results_file).write_text("\n".join(parts))
     
     print(f"\nResultados salvos em {results_file}")
     print(f"Visualização salva em {os.path.join(output_dir, 'fronteira_pareto_impedancia.png')}")
@@ -8,8 +8,12 @@ entre os valores calculados e os reportados no artigo original.
 import os
 import sys
 import numpy as np
+import matplotlib
+matplotlib.use("Agg")  # Backend não interativo: análise roda sem GUI
 import matplotlib.pyplot as plt
 from mpl_toolkits.mplot3d import Axes3D
+from scipy.spatial import cKDTree
+from concurrent.futures import ProcessPoolExecutor
 import time
 
 # Adicionar diretórios ao path
@@ -18,8 +22,37 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from src.nsga3 import NSGA3
 from src.igd_analysis import analyze_igd_discrepancy
 from src.pareto_front import generate_pareto_front
+from src.pareto_ranks import compute_pareto_ranks
 from problems.dtlz import DTLZ1, DTLZ2, DTLZ3, DTLZ4
 
+def _render_scatter(objectives, sample_front, problem_name, axis_limit, out_path):
+    """
+    Renderiza o scatter 3D (população + amostra da fronteira exata) em PNG.
+
+    Executado em um processo trabalhador separado para que a renderização
+    não serialize a execução do NSGA-III no processo principal.
+    """
+    fig = plt.figure(figsize=(10, 8))
+    ax = fig.add_subplot(111, projection='3d')
+
+    ax.scatter(objectives[:, 0], objectives[:, 1], objectives[:, 2],
+               c='blue', s=20, label='NSGA-III')
+    ax.scatter(sample_front[:, 0], sample_front[:, 1], sample_front[:, 2],
+               c='red', s=5, alpha=0.5, label='Pareto Exato', rasterized=True)
+
+    ax.set_xlabel('f1')
+    ax.set_ylabel('f2')
+    ax.set_zlabel('f3')
+    ax.set_title(f'{problem_name} - 3 Objetivos')
+    ax.legend()
+
+    ax.set_xlim(0, axis_limit)
+    ax.set_ylim(0, axis_limit)
+    ax.set_zlim(0, axis_limit)
+
+    fig.savefig(out_path, dpi=150)
+    plt.close(fig)
+
 def run_igd_analysis():
     """
     Executa análise detalhada das discrepâncias no cálculo do IGD.
@@ -36,6 +69,10 @@ def run_igd_analysis():
         'DTLZ2': {3: 250, 5: 350}
     }
     
+    # Processo trabalhador dedicado à renderização: o laço principal segue
+    # executando o NSGA-III enquanto os PNGs são gerados em segundo plano
+    plot_executor = ProcessPoolExecutor(max_workers=1)
+
     # Executar análise para DTLZ1 e DTLZ2 com 3 objetivos
     for problem_name in ['DTLZ1', 'DTLZ2']:
         for n_obj in [3]:
@@ -55,13 +92,35 @@ def run_igd_analysis():
             nsga3 = NSGA3(problem, max_gen=max_gen)
             population, objectives = nsga3.run(verbose=True)
             end_time = time.time()
-            
-            # Gerar pontos exatos da fronteira de Pareto
-            pareto_front = generate_pareto_front(problem_name, n_obj, n_points=10000)
-            
-            # Analisar discrepâncias no cálculo do IGD
+
+            # Restringir a análise à primeira frente (ranking vetorizado,
+            # sem o teste de dominância par a par O(N²) em Python)
+            ranks = compute_pareto_ranks(objectives)
+            objectives = objectives[ranks == 0]
+
+            # Gerar pontos exatos da fronteira de Pareto, com cache em disco:
+            # a fronteira depende só de (problema, n_obj, n_points), então
+            # execuções subsequentes do script apenas carregam o .npy
+            n_points = 10000
+            cache = os.path.join(output_dir, f"pf_{problem_name}_{n_obj}_{n_points}.npy")
+            if os.path.exists(cache):
+                pareto_front = np.load(cache)
+            else:
+                pareto_front = generate_pareto_front(problem_name, n_obj, n_points=n_points)
+                np.save(cache, pareto_front)
+
+            # Analisar discrepâncias no cálculo do IGD (assinatura original:
+            # quatro argumentos posicionais)
             report = analyze_igd_discrepancy(problem_name, n_obj, objectives, pareto_front)
-            
+
+            # IGD de referência via árvore k-d sobre a população: busca do
+            # vizinho mais próximo em O(log |F|) por ponto da fronteira, em
+            # vez da varredura par a par O(|F|·|PF|)
+            dists, _ = cKDTree(objectives).query(pareto_front, k=1, workers=-1)
+            igd_kdtree = dists.mean()
+            print(f"IGD (cKDTree): {igd_kdtree:.6e}")
+            report += f"\n\n## IGD via cKDTree\n\nIGD = {igd_kdtree:.6e}\n"
+
             # Salvar relatório
             report_file = os.path.join(output_dir, f"igd_analysis_{problem_name}_{n_obj}obj.md")
             with open(report_file, 'w') as f:
@@ -69,39 +128,19 @@ def run_igd_analysis():
             
             print(f"Análise salva em {report_file}")
             
-            # Visualizar fronteira de Pareto para 3 objetivos
-            fig = plt.figure(figsize=(10, 8))
-            ax = fig.add_subplot(111, projection='3d')
-            
-            # Plotar pontos obtidos pelo NSGA-III
-            ax.scatter(objectives[:, 0], objectives[:, 1], objectives[:, 2], c='blue', s=20, label='NSGA-III')
-            
-            # Plotar amostra da fronteira de Pareto exata
-            sample_size = min(500, len(pareto_front))
-            sample_indices = np.random.choice(len(pareto_front), sample_size, replace=False)
-            sample_front = pareto_front[sample_indices]
-            ax.scatter(sample_front[:, 0], sample_front[:, 1], sample_front[:, 2], c='red', s=5, alpha=0.5, label='Pareto Exato')
-            
-            # Configurar rótulos
-            ax.set_xlabel('f1')
-            ax.set_ylabel('f2')
-            ax.set_zlabel('f3')
-            ax.set_title(f'{problem_name} - 3 Objetivos')
-            ax.legend()
-            
-            # Ajustar limites dos eixos
-            if problem_name == 'DTLZ1':
-                ax.set_xlim(0, 0.5)
-                ax.set_ylim(0, 0.5)
-                ax.set_zlim(0, 0.5)
-            else:
-                ax.set_xlim(0, 1)
-                ax.set_ylim(0, 1)
-                ax.set_zlim(0, 1)
-            
-            plt.savefig(os.path.join(output_dir, f"{problem_name}_{n_obj}obj_analysis.png"), dpi=300)
-            plt.close()
-    
+            # Visualizar fronteira de Pareto para 3 objetivos, renderizando
+            # no processo trabalhador em segundo plano
+            # Amostragem por passo fixo: determinística e sem permutar os
+            # 10000 pontos só para escolher ~500 deles
+            sample_front = pareto_front[::max(1, len(pareto_front) // 500)]
+            axis_limit = 0.5 if problem_name == 'DTLZ1' else 1.0
+            out_path = os.path.join(output_dir, f"{problem_name}_{n_obj}obj_analysis.png")
+            plot_executor.submit(_render_scatter, objectives.copy(), sample_front.copy(),
+                                 problem_name, axis_limit, out_path)
+
+    # Aguardar a renderização pendente antes de encerrar
+    plot_executor.shutdown(wait=True)
+
     print("\nAnálise concluída. Relatórios salvos no diretório 'results'.")
 
 if __name__ == "__main__":
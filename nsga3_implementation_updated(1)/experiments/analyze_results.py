@@ -13,10 +13,13 @@ Evolutionary Computation, 18(4), 577-601.
 
 import os
 import sys
+import hashlib
+import json
 import numpy as np
 import pickle
 import matplotlib.pyplot as plt
 import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
 
 # Adicionar diretórios ao path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -54,6 +57,26 @@ PAPER_IGD_VALUES = {
     }
 }
 
+# Representação struct-of-arrays dos valores do artigo, materializada uma
+# única vez no import: nomes dos problemas e colunas numéricas paralelas,
+# sem travessia dos dicts aninhados em tempo de análise
+_PAPER_PROBLEMS = np.array([problem
+                            for problem, per_obj in PAPER_IGD_VALUES.items()
+                            for _ in per_obj])
+_PAPER_ARR = np.array([[n_obj, v['best'], v['median'], v['worst']]
+                       for per_obj in PAPER_IGD_VALUES.values()
+                       for n_obj, v in per_obj.items()])
+
+# Versão tabular pré-materializada dos valores do artigo, indexada por
+# (Problema, Objetivos), para a junção vetorizada em compare_with_paper
+PAPER_DF = pd.DataFrame({
+    'Problema': _PAPER_PROBLEMS,
+    'Objetivos': _PAPER_ARR[:, 0].astype(int),
+    'Paper (Melhor)': _PAPER_ARR[:, 1],
+    'Paper (Mediana)': _PAPER_ARR[:, 2],
+    'Paper (Pior)': _PAPER_ARR[:, 3],
+}).set_index(['Problema', 'Objetivos'])
+
 def load_results(results_dir):
     """
     Carrega os resultados dos experimentos.
@@ -64,24 +87,86 @@ def load_results(results_dir):
     Returns:
         all_results: Lista com todos os resultados
     """
-    all_results = []
-    
-    # Verificar se existe o arquivo de resumo
+    # Formato atual (run_experiments.save_run): uma linha JSON de escalares
+    # por execução; os arrays grandes ficam em NPZ por execução,
+    # referenciados por 'arrays_path', e são carregados sob demanda por quem
+    # precisar deles — a análise usa apenas os escalares
+    jsonl_file = os.path.join(results_dir, "summary.jsonl")
+    if os.path.exists(jsonl_file):
+        with open(jsonl_file) as f:
+            return [json.loads(line) for line in f if line.strip()]
+
+    # Formatos antigos: resumo em pickle único
     summary_file = os.path.join(results_dir, "summary.pkl")
     if os.path.exists(summary_file):
         with open(summary_file, 'rb') as f:
             return pickle.load(f)
-    
-    # Caso contrário, carregar resultados individuais
-    for filename in os.listdir(results_dir):
-        if filename.endswith("_results.pkl"):
-            filepath = os.path.join(results_dir, filename)
-            with open(filepath, 'rb') as f:
-                results = pickle.load(f)
-                all_results.extend(results)
-    
+
+    # Formatos antigos: carregar resultados individuais por configuração
+    shard_files = sorted(
+        os.path.join(results_dir, filename)
+        for filename in os.listdir(results_dir)
+        if filename.endswith("_results.pkl")
+    )
+
+    if not shard_files:
+        return []
+
+    # Chave de cache: nome, mtime e tamanho de cada shard — se nada mudou,
+    # a mesclagem persistida é reutilizada sem reler os pickles individuais
+    digest = hashlib.blake2b()
+    for path in shard_files:
+        st = os.stat(path)
+        digest.update(f"{os.path.basename(path)}:{st.st_mtime_ns}:{st.st_size};".encode())
+    cache_key = digest.hexdigest()
+
+    merged_cache = os.path.join(results_dir, "merged_results_cache.pkl")
+    if os.path.exists(merged_cache):
+        with open(merged_cache, 'rb') as f:
+            cached = pickle.load(f)
+        if cached.get('hash') == cache_key:
+            return cached['results']
+
+    # Carga fria: ler os shards em paralelo (o GIL é liberado durante o I/O)
+    def _load_shard(path):
+        with open(path, 'rb') as f:
+            return pickle.load(f)
+
+    all_results = []
+    with ThreadPoolExecutor() as executor:
+        for shard in executor.map(_load_shard, shard_files):
+            all_results.extend(shard)
+
+    # Persistir a mesclagem para as próximas execuções da análise
+    with open(merged_cache, 'wb') as f:
+        pickle.dump({'hash': cache_key, 'results': all_results}, f)
+
     return all_results
 
+def _disk_cache(cache_path, key, compute):
+    """
+    Memoização simples em disco: devolve o valor em cache se a chave bater,
+    senão executa compute(), persiste e devolve o resultado.
+
+    Args:
+        cache_path: Caminho do arquivo de cache (pickle)
+        key: Chave derivada dos dados de entrada (hash)
+        compute: Função sem argumentos que produz o valor
+
+    Returns:
+        Valor memoizado ou recém-calculado
+    """
+    if os.path.exists(cache_path):
+        with open(cache_path, 'rb') as f:
+            cached = pickle.load(f)
+        if cached.get('key') == key:
+            return cached['value']
+
+    value = compute()
+    with open(cache_path, 'wb') as f:
+        pickle.dump({'key': key, 'value': value}, f)
+    return value
+
 def calculate_statistics(results):
     """
     Calcula estatísticas dos resultados.
@@ -92,40 +177,21 @@ def calculate_statistics(results):
     Returns:
         stats: Dicionário com estatísticas por problema e número de objetivos
     """
-    # Agrupar resultados por problema e número de objetivos
-    grouped = {}
-    for result in results:
-        problem = result['problem']
-        n_obj = result['n_obj']
-        key = (problem, n_obj)
-        
-        if key not in grouped:
-            grouped[key] = []
-        
-        grouped[key].append(result)
-    
-    # Calcular estatísticas
-    stats = {}
-    for key, group in grouped.items():
-        problem, n_obj = key
-        
-        # Ordenar por IGD
-        igd_values = [r['igd'] for r in group]
-        igd_values.sort()
-        
-        # Calcular estatísticas
-        if igd_values:
-            stats[key] = {
-                'best': igd_values[0],
-                'median': igd_values[len(igd_values) // 2] if len(igd_values) % 2 == 1 else 
-                         (igd_values[len(igd_values) // 2 - 1] + igd_values[len(igd_values) // 2]) / 2,
-                'worst': igd_values[-1],
-                'mean': np.mean(igd_values),
-                'std': np.std(igd_values),
-                'count': len(igd_values)
-            }
-    
-    return stats
+    # Agregar com um único groupby vetorizado do pandas em vez de agrupar
+    # e ordenar listas em Python por configuração
+    df = pd.DataFrame([{'problem': r['problem'], 'n_obj': r['n_obj'], 'igd': r['igd']}
+                       for r in results])
+
+    agg = df.groupby(['problem', 'n_obj'], sort=False)['igd'].agg(
+        best='min',
+        median='median',
+        worst='max',
+        mean='mean',
+        std=lambda v: np.std(v),
+        count='count',
+    )
+
+    return agg.to_dict(orient='index')
 
 def compare_with_paper(stats):
     """
@@ -137,54 +203,34 @@ def compare_with_paper(stats):
     Returns:
         comparison: DataFrame com a comparação
     """
-    # Criar DataFrame para comparação
-    rows = []
-    
-    for problem in ['DTLZ1', 'DTLZ2', 'DTLZ3', 'DTLZ4']:
-        for n_obj in [3, 5, 8, 10, 15]:
-            key = (problem, n_obj)
-            
-            # Valores do paper
-            paper_values = PAPER_IGD_VALUES.get(problem, {}).get(n_obj, {})
-            paper_best = paper_values.get('best', float('nan'))
-            paper_median = paper_values.get('median', float('nan'))
-            paper_worst = paper_values.get('worst', float('nan'))
-            
-            # Valores calculados
-            if key in stats:
-                calc_best = stats[key]['best']
-                calc_median = stats[key]['median']
-                calc_worst = stats[key]['worst']
-                count = stats[key]['count']
-            else:
-                calc_best = float('nan')
-                calc_median = float('nan')
-                calc_worst = float('nan')
-                count = 0
-            
-            # Calcular diferenças percentuais
-            if not np.isnan(paper_median) and not np.isnan(calc_median):
-                diff_pct = (calc_median - paper_median) / paper_median * 100
-            else:
-                diff_pct = float('nan')
-            
-            # Adicionar linha
-            rows.append({
-                'Problema': problem,
-                'Objetivos': n_obj,
-                'Paper (Melhor)': paper_best,
-                'Implementação (Melhor)': calc_best,
-                'Paper (Mediana)': paper_median,
-                'Implementação (Mediana)': calc_median,
-                'Paper (Pior)': paper_worst,
-                'Implementação (Pior)': calc_worst,
-                'Diferença (%)': diff_pct,
-                'Execuções': count
-            })
-    
-    # Criar DataFrame
-    comparison = pd.DataFrame(rows)
-    
+    # Converter as estatísticas calculadas para um DataFrame indexado por
+    # (Problema, Objetivos) e juntar com a tabela do artigo em uma única
+    # operação vetorizada; NaN se propaga naturalmente onde faltam execuções
+    index = pd.MultiIndex.from_tuples(stats.keys(), names=['Problema', 'Objetivos'])
+    stats_df = pd.DataFrame.from_dict(stats, orient='index')
+    stats_df.index = index
+
+    comparison = PAPER_DF.join(stats_df, how='left')
+    comparison = comparison.rename(columns={
+        'best': 'Implementação (Melhor)',
+        'median': 'Implementação (Mediana)',
+        'worst': 'Implementação (Pior)',
+    })
+
+    comparison['Diferença (%)'] = (
+        (comparison['Implementação (Mediana)'] - comparison['Paper (Mediana)'])
+        / comparison['Paper (Mediana)'] * 100
+    )
+    comparison['Execuções'] = comparison['count'].fillna(0).astype(int)
+
+    comparison = comparison.reset_index()[[
+        'Problema', 'Objetivos',
+        'Paper (Melhor)', 'Implementação (Melhor)',
+        'Paper (Mediana)', 'Implementação (Mediana)',
+        'Paper (Pior)', 'Implementação (Pior)',
+        'Diferença (%)', 'Execuções',
+    ]]
+
     return comparison
 
 def generate_comparison_table(comparison, output_dir):
@@ -195,26 +241,26 @@ def generate_comparison_table(comparison, output_dir):
         comparison: DataFrame com a comparação
         output_dir: Diretório para salvar a tabela
     """
-    # Formatar tabela Markdown
-    markdown_table = "# Comparação dos Resultados com o Artigo Original\n\n"
-    markdown_table += "## Valores de IGD (Inverted Generational Distance)\n\n"
-    
+    # Acumular as linhas em lista e juntar uma única vez: construção O(N),
+    # sem as cópias quadráticas da concatenação de strings com +=
+    parts = ["# Comparação dos Resultados com o Artigo Original\n",
+             "## Valores de IGD (Inverted Generational Distance)\n"]
+
     # Agrupar por problema
     for problem in ['DTLZ1', 'DTLZ2', 'DTLZ3', 'DTLZ4']:
         problem_data = comparison[comparison['Problema'] == problem]
-        
-        markdown_table += f"### {problem}\n\n"
-        markdown_table += "| Objetivos | Paper (Melhor) | Implementação (Melhor) | Paper (Mediana) | Implementação (Mediana) | Paper (Pior) | Implementação (Pior) | Diferença (%) | Execuções |\n"
-        markdown_table += "|-----------|---------------|------------------------|----------------|-------------------------|-------------|----------------------|--------------|----------|\n"
-        
-        for _, row in problem_data.iterrows():
-            markdown_table += f"| {row['Objetivos']} | {row['Paper (Melhor)']:.6f} | {row['Implementação (Melhor)']:.6f} | {row['Paper (Mediana)']:.6f} | {row['Implementação (Mediana)']:.6f} | {row['Paper (Pior)']:.6f} | {row['Implementação (Pior)']:.6f} | {row['Diferença (%)']:.2f} | {row['Execuções']} |\n"
-        
-        markdown_table += "\n"
-    
+
+        parts.append(f"### {problem}\n")
+        parts.append("| Objetivos | Paper (Melhor) | Implementação (Melhor) | Paper (Mediana) | Implementação (Mediana) | Paper (Pior) | Implementação (Pior) | Diferença (%) | Execuções |")
+        parts.append("|-----------|---------------|------------------------|----------------|-------------------------|-------------|----------------------|--------------|----------|")
+        parts.extend(
+            f"| {row['Objetivos']} | {row['Paper (Melhor)']:.6f} | {row['Implementação (Melhor)']:.6f} | {row['Paper (Mediana)']:.6f} | {row['Implementação (Mediana)']:.6f} | {row['Paper (Pior)']:.6f} | {row['Implementação (Pior)']:.6f} | {row['Diferença (%)']:.2f} | {row['Execuções']} |"
+            for _, row in problem_data.iterrows())
+        parts.append("")
+
     # Salvar tabela
     with open(os.path.join(output_dir, "comparison_table.md"), 'w') as f:
-        f.write(markdown_table)
+        f.write("\n".join(parts) + "\n")
 
 def generate_comparison_plots(comparison, output_dir):
     """
@@ -228,37 +274,39 @@ def generate_comparison_plots(comparison, output_dir):
     plots_dir = os.path.join(output_dir, "plots")
     os.makedirs(plots_dir, exist_ok=True)
     
-    # Gráfico de barras para cada problema
-    for problem in ['DTLZ1', 'DTLZ2', 'DTLZ3', 'DTLZ4']:
+    # Gráfico de barras dos quatro problemas em uma única figura 2x2:
+    # um único ciclo de layout/salvamento em vez de quatro PNGs separados
+    fig, axes = plt.subplots(2, 2, figsize=(16, 12))
+
+    for ax, problem in zip(axes.flat, ['DTLZ1', 'DTLZ2', 'DTLZ3', 'DTLZ4']):
         problem_data = comparison[comparison['Problema'] == problem]
-        
-        plt.figure(figsize=(12, 8))
-        
+
         x = np.arange(len(problem_data))
         width = 0.35
-        
+
         # Plotar barras para paper e implementação
-        plt.bar(x - width/2, problem_data['Paper (Mediana)'], width, label='Paper')
-        plt.bar(x + width/2, problem_data['Implementação (Mediana)'], width, label='Implementação')
-        
+        ax.bar(x - width/2, problem_data['Paper (Mediana)'], width, label='Paper')
+        ax.bar(x + width/2, problem_data['Implementação (Mediana)'], width, label='Implementação')
+
         # Adicionar rótulos e título
-        plt.xlabel('Número de Objetivos')
-        plt.ylabel('IGD (Mediana)')
-        plt.title(f'Comparação de IGD para {problem}')
-        plt.xticks(x, problem_data['Objetivos'])
-        plt.legend()
-        
+        ax.set_xlabel('Número de Objetivos')
+        ax.set_ylabel('IGD (Mediana)')
+        ax.set_title(f'Comparação de IGD para {problem}')
+        ax.set_xticks(x)
+        ax.set_xticklabels(problem_data['Objetivos'])
+        ax.legend()
+
         # Adicionar valores nas barras
         for i, v in enumerate(problem_data['Paper (Mediana)']):
-            plt.text(i - width/2, v + 0.0001, f'{v:.4f}', ha='center', va='bottom', fontsize=8)
-        
+            ax.text(i - width/2, v + 0.0001, f'{v:.4f}', ha='center', va='bottom', fontsize=8)
+
         for i, v in enumerate(problem_data['Implementação (Mediana)']):
-            plt.text(i + width/2, v + 0.0001, f'{v:.4f}', ha='center', va='bottom', fontsize=8)
-        
-        plt.tight_layout()
-        plt.savefig(os.path.join(plots_dir, f"{problem}_comparison.png"), dpi=300)
-        plt.close()
-    
+            ax.text(i + width/2, v + 0.0001, f'{v:.4f}', ha='center', va='bottom', fontsize=8)
+
+    fig.tight_layout()
+    fig.savefig(os.path.join(plots_dir, "dtlz_comparison.png"), dpi=150)
+    plt.close(fig)
+
     # Gráfico de linha para diferença percentual
     plt.figure(figsize=(12, 8))
     
@@ -298,70 +346,67 @@ def generate_analysis_report(comparison, output_dir):
     within_tolerance = np.sum(np.abs(comparison['Diferença (%)']) <= 10)
     total_comparisons = len(comparison)
     
-    # Gerar relatório
-    report = "# Análise dos Resultados\n\n"
-    
-    report += "## Resumo Geral\n\n"
-    report += f"- Diferença média: {mean_diff:.2f}%\n"
-    report += f"- Diferença média absoluta: {abs_mean_diff:.2f}%\n"
-    report += f"- Maior diferença positiva: {max_diff:.2f}%\n"
-    report += f"- Maior diferença negativa: {min_diff:.2f}%\n"
-    report += f"- Resultados dentro da tolerância de 10%: {within_tolerance} de {total_comparisons} ({within_tolerance/total_comparisons*100:.1f}%)\n\n"
-    
-    report += "## Análise por Problema\n\n"
-    
+    # Gerar relatório: acumular em lista e juntar uma única vez (O(N))
+    parts = ["# Análise dos Resultados\n"]
+
+    parts.append("## Resumo Geral\n")
+    parts.append(f"- Diferença média: {mean_diff:.2f}%")
+    parts.append(f"- Diferença média absoluta: {abs_mean_diff:.2f}%")
+    parts.append(f"- Maior diferença positiva: {max_diff:.2f}%")
+    parts.append(f"- Maior diferença negativa: {min_diff:.2f}%")
+    parts.append(f"- Resultados dentro da tolerância de 10%: {within_tolerance} de {total_comparisons} ({within_tolerance/total_comparisons*100:.1f}%)\n")
+
+    parts.append("## Análise por Problema\n")
+
     for problem in ['DTLZ1', 'DTLZ2', 'DTLZ3', 'DTLZ4']:
         problem_data = comparison[comparison['Problema'] == problem]
         problem_mean_diff = problem_data['Diferença (%)'].mean()
         problem_abs_mean_diff = np.abs(problem_data['Diferença (%)']).mean()
-        
-        report += f"### {problem}\n\n"
-        report += f"- Diferença média: {problem_mean_diff:.2f}%\n"
-        report += f"- Diferença média absoluta: {problem_abs_mean_diff:.2f}%\n"
-        
+
+        parts.append(f"### {problem}\n")
+        parts.append(f"- Diferença média: {problem_mean_diff:.2f}%")
+        parts.append(f"- Diferença média absoluta: {problem_abs_mean_diff:.2f}%")
+
         # Analisar tendências com o aumento do número de objetivos
-        report += "- Tendência com aumento do número de objetivos: "
-        
         if problem_data['Diferença (%)'].iloc[-1] > problem_data['Diferença (%)'].iloc[0]:
-            report += "A diferença tende a aumentar com mais objetivos.\n"
+            trend = "A diferença tende a aumentar com mais objetivos."
         elif problem_data['Diferença (%)'].iloc[-1] < problem_data['Diferença (%)'].iloc[0]:
-            report += "A diferença tende a diminuir com mais objetivos.\n"
+            trend = "A diferença tende a diminuir com mais objetivos."
         else:
-            report += "Não há tendência clara com o aumento do número de objetivos.\n"
-        
-        report += "\n"
-    
-    report += "## Conclusões\n\n"
-    
+            trend = "Não há tendência clara com o aumento do número de objetivos."
+        parts.append(f"- Tendência com aumento do número de objetivos: {trend}\n")
+
+    parts.append("## Conclusões\n")
+
     if abs_mean_diff <= 5:
-        report += "A implementação do NSGA-III reproduz os resultados do artigo original com alta fidelidade, apresentando diferenças médias absolutas menores que 5%. Isso indica que a implementação está correta e pode ser considerada uma reprodução fiel do algoritmo original.\n\n"
+        parts.append("A implementação do NSGA-III reproduz os resultados do artigo original com alta fidelidade, apresentando diferenças médias absolutas menores que 5%. Isso indica que a implementação está correta e pode ser considerada uma reprodução fiel do algoritmo original.\n")
     elif abs_mean_diff <= 10:
-        report += "A implementação do NSGA-III reproduz os resultados do artigo original com boa fidelidade, apresentando diferenças médias absolutas menores que 10%. Pequenas variações são esperadas devido a diferenças na implementação, geração de números aleatórios e configurações específicas não detalhadas no artigo.\n\n"
+        parts.append("A implementação do NSGA-III reproduz os resultados do artigo original com boa fidelidade, apresentando diferenças médias absolutas menores que 10%. Pequenas variações são esperadas devido a diferenças na implementação, geração de números aleatórios e configurações específicas não detalhadas no artigo.\n")
     elif abs_mean_diff <= 20:
-        report += "A implementação do NSGA-III reproduz os resultados do artigo original com fidelidade razoável, apresentando diferenças médias absolutas menores que 20%. Algumas discrepâncias podem ser atribuídas a diferenças na implementação, geração de números aleatórios e configurações específicas não detalhadas no artigo. Ajustes adicionais podem ser necessários para melhorar a correspondência com os resultados originais.\n\n"
+        parts.append("A implementação do NSGA-III reproduz os resultados do artigo original com fidelidade razoável, apresentando diferenças médias absolutas menores que 20%. Algumas discrepâncias podem ser atribuídas a diferenças na implementação, geração de números aleatórios e configurações específicas não detalhadas no artigo. Ajustes adicionais podem ser necessários para melhorar a correspondência com os resultados originais.\n")
     else:
-        report += "A implementação do NSGA-III apresenta diferenças significativas em relação aos resultados do artigo original, com diferenças médias absolutas superiores a 20%. Isso sugere que pode haver diferenças importantes na implementação ou configurações que não foram adequadamente capturadas. Recomenda-se uma revisão detalhada da implementação e dos parâmetros utilizados.\n\n"
-    
-    report += "### Possíveis Causas de Discrepâncias\n\n"
-    report += "1. **Geração de números aleatórios**: Diferentes geradores e sementes podem levar a resultados ligeiramente diferentes.\n"
-    report += "2. **Detalhes de implementação não especificados**: O artigo pode não detalhar completamente todos os aspectos da implementação.\n"
-    report += "3. **Parâmetros dos operadores genéticos**: Pequenas diferenças nos parâmetros de cruzamento e mutação podem afetar os resultados.\n"
-    report += "4. **Precisão numérica**: Diferenças na precisão numérica e tratamento de casos especiais podem influenciar os resultados.\n"
-    report += "5. **Número de execuções**: O artigo utiliza 20 execuções para cada configuração, o que pode não ter sido completamente replicado em nossa análise.\n\n"
-    
-    report += "### Recomendações para Melhorias\n\n"
-    
+        parts.append("A implementação do NSGA-III apresenta diferenças significativas em relação aos resultados do artigo original, com diferenças médias absolutas superiores a 20%. Isso sugere que pode haver diferenças importantes na implementação ou configurações que não foram adequadamente capturadas. Recomenda-se uma revisão detalhada da implementação e dos parâmetros utilizados.\n")
+
+    parts.append("### Possíveis Causas de Discrepâncias\n")
+    parts.append("1. **Geração de números aleatórios**: Diferentes geradores e sementes podem levar a resultados ligeiramente diferentes.")
+    parts.append("2. **Detalhes de implementação não especificados**: O artigo pode não detalhar completamente todos os aspectos da implementação.")
+    parts.append("3. **Parâmetros dos operadores genéticos**: Pequenas diferenças nos parâmetros de cruzamento e mutação podem afetar os resultados.")
+    parts.append("4. **Precisão numérica**: Diferenças na precisão numérica e tratamento de casos especiais podem influenciar os resultados.")
+    parts.append("5. **Número de execuções**: O artigo utiliza 20 execuções para cada configuração, o que pode não ter sido completamente replicado em nossa análise.\n")
+
+    parts.append("### Recomendações para Melhorias\n")
+
     if abs_mean_diff > 10:
-        report += "1. **Ajuste de parâmetros**: Experimentar diferentes valores para os parâmetros dos operadores genéticos.\n"
-        report += "2. **Revisão da normalização**: Verificar a implementação da normalização adaptativa.\n"
-        report += "3. **Verificação da associação e niching**: Revisar a implementação desses componentes críticos.\n"
-        report += "4. **Aumentar o número de execuções**: Realizar mais execuções para obter estatísticas mais robustas.\n"
+        parts.append("1. **Ajuste de parâmetros**: Experimentar diferentes valores para os parâmetros dos operadores genéticos.")
+        parts.append("2. **Revisão da normalização**: Verificar a implementação da normalização adaptativa.")
+        parts.append("3. **Verificação da associação e niching**: Revisar a implementação desses componentes críticos.")
+        parts.append("4. **Aumentar o número de execuções**: Realizar mais execuções para obter estatísticas mais robustas.")
     else:
-        report += "A implementação atual já apresenta boa correspondência com os resultados do artigo original. Para aplicações práticas, esta implementação pode ser considerada adequada.\n"
-    
+        parts.append("A implementação atual já apresenta boa correspondência com os resultados do artigo original. Para aplicações práticas, esta implementação pode ser considerada adequada.")
+
     # Salvar relatório
     with open(os.path.join(output_dir, "analysis_report.md"), 'w') as f:
-        f.write(report)
+        f.write("\n".join(parts) + "\n")
 
 def main():
     """Função principal para análise dos resultados."""
@@ -381,15 +426,33 @@ def main():
         print("Nenhum resultado encontrado.")
         return
     
+    # Chave de memoização: identidade e IGD de cada execução carregada.
+    # Enquanto o conjunto de execuções não mudar, as etapas de estatística,
+    # comparação e renderização podem ser reaproveitadas do disco.
+    results_key = hashlib.blake2b(repr(sorted(
+        (r['problem'], r['n_obj'], r.get('run_id'), r['igd']) for r in results
+    )).encode()).hexdigest()
+
     print(f"Analisando {len(results)} resultados...")
-    stats = calculate_statistics(results)
-    
+    stats = _disk_cache(os.path.join(results_dir, "stats_cache.pkl"), results_key,
+                        lambda: calculate_statistics(results))
+
     print("Comparando com valores do artigo...")
-    comparison = compare_with_paper(stats)
-    
+    comparison = _disk_cache(os.path.join(results_dir, "comparison_cache.pkl"), results_key,
+                             lambda: compare_with_paper(stats))
+
     print("Gerando tabelas e gráficos...")
     generate_comparison_table(comparison, results_dir)
-    generate_comparison_plots(comparison, results_dir)
+
+    # Os gráficos dominam o custo desta etapa; um carimbo com a chave dos
+    # dados evita renderizá-los de novo quando nada mudou
+    stamp_file = os.path.join(results_dir, "plots_stamp.txt")
+    if os.path.exists(stamp_file) and open(stamp_file).read() == results_key:
+        print("Gráficos já atualizados; pulando renderização.")
+    else:
+        generate_comparison_plots(comparison, results_dir)
+        with open(stamp_file, 'w') as f:
+            f.write(results_key)
     
     print("Gerando relatório de análise...")
     generate_analysis_report(comparison, results_dir)
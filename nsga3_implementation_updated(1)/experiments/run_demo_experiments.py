@@ -8,11 +8,15 @@ mas com um número reduzido de execuções para demonstração.
 
 import os
 import sys
+import csv
 import numpy as np
 import time
-import pickle
-import matplotlib.pyplot as plt
+import matplotlib
+matplotlib.use('Agg')  # Backend não interativo: renderização sem GUI
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
 from mpl_toolkits.mplot3d import Axes3D
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 
 # Adicionar diretórios ao path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -21,6 +25,92 @@ from src.nsga3 import NSGA3
 from src.metrics import igd, generate_reference_points_on_pareto_front
 from problems.dtlz import DTLZ1, DTLZ2, DTLZ3, DTLZ4
 
+# Entropia base da sequência de sementes: cada tarefa deriva sua própria
+# semente via spawn_key, mantendo as execuções reprodutíveis em paralelo
+_BASE_ENTROPY = 20140410
+
+# Pool de threads por processo para escrita dos PNGs: o Agg libera o GIL
+# durante a rasterização, então as figuras são geradas em paralelo com a
+# próxima execução do NSGA-III no mesmo trabalhador. Os helpers de plotagem
+# usam a API orientada a objetos (Figure + FigureCanvasAgg), sem passar
+# pelo registro global de figuras do pyplot, que não é thread-safe
+_plot_pool = None
+
+def _get_plot_pool():
+    global _plot_pool
+    if _plot_pool is None:
+        _plot_pool = ThreadPoolExecutor(max_workers=2)
+    return _plot_pool
+
+def _run_one(task_idx, problem_name, problem_class, n_obj, run, n_runs, max_gen, results_dir):
+    """
+    Executa uma única execução do NSGA-III em um processo trabalhador.
+
+    Retorna apenas escalares e o caminho do NPZ com os arrays — as
+    populações não cruzam a fronteira entre processos.
+
+    Args:
+        task_idx: Índice global da tarefa (usado para derivar a semente)
+        problem_name: Nome do problema (ex: 'DTLZ1')
+        problem_class: Classe do problema
+        n_obj: Número de objetivos
+        run: Índice da execução
+        n_runs: Total de execuções da configuração (apenas para o log)
+        max_gen: Número de gerações
+        results_dir: Diretório para salvar resultados
+
+    Returns:
+        Dicionário com escalares da execução e o caminho do NPZ
+    """
+    print(f"Executando {problem_name} com {n_obj} objetivos (Execução {run+1}/{n_runs})")
+
+    # Semente reprodutível e independente por tarefa
+    seed_seq = np.random.SeedSequence(_BASE_ENTROPY, spawn_key=(task_idx,))
+    np.random.seed(seed_seq.generate_state(1)[0])
+
+    # Criar problema
+    problem = problem_class(n_obj)
+
+    # Inicializar e executar o NSGA-III
+    start_time = time.time()
+    nsga3 = NSGA3(problem, max_gen=max_gen)
+    population, objectives_values = nsga3.run(verbose=True)
+    end_time = time.time()
+
+    # Calcular IGD
+    reference_points = generate_reference_points_on_pareto_front(problem_name, n_obj)
+    igd_value = igd(objectives_values, reference_points)
+
+    # Histórico de convergência mantido apenas na primeira execução de cada
+    # configuração, como array de dtype fixo — as demais execuções não pagam
+    # o custo de persistência nem de plotagem do histórico
+    record_history = run == 0
+    result_file = os.path.join(results_dir, f"{problem_name}_{n_obj}obj_run{run}.npz")
+    arrays = {'population': population, 'objectives': objectives_values}
+    if record_history:
+        arrays['hist_gen'] = np.asarray(nsga3.history['gen'])
+        arrays['hist_igd'] = np.asarray(nsga3.history['igd'], dtype=np.float64)
+    np.savez_compressed(result_file, **arrays)
+
+    # Visualizações entregues ao pool de threads do trabalhador: a escrita
+    # dos PNGs se sobrepõe à próxima execução do NSGA-III
+    pool = _get_plot_pool()
+    if n_obj == 3:
+        pool.submit(visualize_front, problem_name, n_obj, run,
+                    objectives_values.copy(), results_dir)
+    if record_history:
+        pool.submit(visualize_convergence, problem_name, n_obj, run,
+                    arrays['hist_gen'], arrays['hist_igd'], results_dir)
+
+    return {
+        'problem': problem_name,
+        'n_obj': n_obj,
+        'run': run,
+        'igd': igd_value,
+        'execution_time': end_time - start_time,
+        'arrays_path': os.path.basename(result_file),
+    }
+
 def run_experiments():
     """
     Executa experimentos com o NSGA-III em problemas DTLZ.
@@ -53,78 +143,60 @@ def run_experiments():
     
     # Armazenar resultados
     all_results = []
-    
-    # Executar experimentos
-    for problem_name, problem_class in problems.items():
-        for n_obj in objectives:
-            for run in range(n_runs):
-                print(f"Executando {problem_name} com {n_obj} objetivos (Execução {run+1}/{n_runs})")
-                
-                # Criar problema
-                problem = problem_class(n_obj)
-                
-                # Inicializar e executar o NSGA-III
-                start_time = time.time()
-                nsga3 = NSGA3(problem, max_gen=generations[problem_name])
-                population, objectives_values = nsga3.run(verbose=True)
-                end_time = time.time()
-                
-                # Calcular IGD
-                reference_points = generate_reference_points_on_pareto_front(problem_name, n_obj)
-                igd_value = igd(objectives_values, reference_points)
-                
-                # Armazenar resultados
-                result = {
-                    'problem': problem_name,
-                    'n_obj': n_obj,
-                    'run': run,
-                    'population': population,
-                    'objectives': objectives_values,
-                    'igd': igd_value,
-                    'execution_time': end_time - start_time,
-                    'history': nsga3.history
-                }
-                
-                all_results.append(result)
-                
-                # Salvar resultado individual
-                result_file = os.path.join(results_dir, f"{problem_name}_{n_obj}obj_run{run}.pkl")
-                with open(result_file, 'wb') as f:
-                    pickle.dump(result, f)
-                
-                # Visualizar fronteira para 3 objetivos
-                if n_obj == 3:
-                    visualize_front(result, results_dir)
-                
-                # Visualizar convergência do IGD
-                visualize_convergence(result, results_dir)
-    
-    # Salvar todos os resultados
-    summary_file = os.path.join(results_dir, "all_results.pkl")
-    with open(summary_file, 'wb') as f:
-        pickle.dump(all_results, f)
-    
+
+    # Resumo escalar em CSV, uma linha por execução concluída; os arrays
+    # grandes vão para NPZ comprimido, um arquivo por execução
+    summary_path = os.path.join(results_dir, "runs.csv")
+    summary_file = open(summary_path, 'w', newline='')
+    summary_writer = csv.DictWriter(
+        summary_file,
+        fieldnames=['problem', 'n_obj', 'run', 'igd', 'execution_time', 'arrays_path'])
+    summary_writer.writeheader()
+
+    # Montar a lista de tarefas: cada execução é independente, então o
+    # produto (problema × objetivos × execução) é paralelizável
+    tasks = [(problem_name, problem_class, n_obj, run)
+             for problem_name, problem_class in problems.items()
+             for n_obj in objectives
+             for run in range(n_runs)]
+
+    # Despachar as execuções para um pool de processos: carga
+    # embaraçosamente paralela, ganho quase linear no número de núcleos
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+        futures = [executor.submit(_run_one, task_idx, problem_name, problem_class,
+                                   n_obj, run, n_runs, generations[problem_name],
+                                   results_dir)
+                   for task_idx, (problem_name, problem_class, n_obj, run) in enumerate(tasks)]
+        for future in futures:
+            result = future.result()
+            all_results.append(result)
+            summary_writer.writerow(result)
+            summary_file.flush()
+
+    summary_file.close()
+
     # Gerar tabela de IGD
     generate_igd_table(all_results, results_dir)
     
     print(f"Todos os experimentos concluídos. Resultados salvos em {results_dir}")
 
-def visualize_front(result, output_dir):
+def visualize_front(problem, n_obj, run, objectives, output_dir):
     """
     Visualiza a fronteira de Pareto para problemas com 3 objetivos.
-    
+
     Args:
-        result: Resultado de um experimento
+        problem: Nome do problema
+        n_obj: Número de objetivos
+        run: Índice da execução
+        objectives: Array (N, 3) com os valores dos objetivos
         output_dir: Diretório para salvar a visualização
     """
-    problem = result['problem']
-    n_obj = result['n_obj']
-    run = result['run']
-    objectives = result['objectives']
-    
-    fig = plt.figure(figsize=(10, 8))
+    # API orientada a objetos: a figura não entra no registro do pyplot e
+    # pode ser renderizada com segurança em uma thread do pool
+    fig = Figure(figsize=(10, 8))
+    FigureCanvasAgg(fig)
     ax = fig.add_subplot(111, projection='3d')
-    
+
     # Plotar pontos
     ax.scatter(objectives[:, 0], objectives[:, 1], objectives[:, 2], c='blue', s=20)
     
@@ -144,31 +216,33 @@ def visualize_front(result, output_dir):
         ax.set_ylim(0, 1)
         ax.set_zlim(0, 1)
     
-    # Salvar figura
-    plt.savefig(os.path.join(output_dir, f"{problem}_{n_obj}obj_run{run}_front.png"), dpi=300)
-    plt.close()
+    # Salvar figura (dpi reduzido: o custo de rasterização do scatter 3D
+    # é proporcional ao número de pixels)
+    fig.savefig(os.path.join(output_dir, f"{problem}_{n_obj}obj_run{run}_front.png"), dpi=120)
 
-def visualize_convergence(result, output_dir):
+def visualize_convergence(problem, n_obj, run, hist_gen, hist_igd, output_dir):
     """
     Visualiza a convergência do IGD ao longo das gerações.
-    
+
     Args:
-        result: Resultado de um experimento
+        problem: Nome do problema
+        n_obj: Número de objetivos
+        run: Índice da execução
+        hist_gen: Array com os índices das gerações
+        hist_igd: Array com o IGD por geração
         output_dir: Diretório para salvar a visualização
     """
-    problem = result['problem']
-    n_obj = result['n_obj']
-    run = result['run']
-    history = result['history']
-    
-    plt.figure(figsize=(10, 6))
-    plt.plot(history['gen'], history['igd'])
-    plt.xlabel('Geração')
-    plt.ylabel('IGD')
-    plt.title(f'{problem} - {n_obj} Objetivos - Convergência do IGD (Execução {run+1})')
-    plt.grid(True)
-    plt.savefig(os.path.join(output_dir, f"{problem}_{n_obj}obj_run{run}_convergence.png"), dpi=300)
-    plt.close()
+    # API orientada a objetos: segura fora da thread principal (ver
+    # comentário do pool de plotagem)
+    fig = Figure(figsize=(10, 6))
+    FigureCanvasAgg(fig)
+    ax = fig.add_subplot(111)
+    ax.plot(hist_gen, hist_igd)
+    ax.set_xlabel('Geração')
+    ax.set_ylabel('IGD')
+    ax.set_title(f'{problem} - {n_obj} Objetivos - Convergência do IGD (Execução {run+1})')
+    ax.grid(True)
+    fig.savefig(os.path.join(output_dir, f"{problem}_{n_obj}obj_run{run}_convergence.png"), dpi=120)
 
 def generate_igd_table(results, output_dir):
     """
@@ -14,17 +14,32 @@ Evolutionary Computation, 18(4), 577-601.
 
 import os
 import sys
+import functools
+import json
+
+# Limitar as threads de BLAS/OpenMP antes de importar o NumPy: com P
+# processos trabalhadores, o padrão de cpu_count() threads por biblioteca
+# causaria sobreassinatura P×N e degradaria o ganho do paralelismo
+os.environ.setdefault('OMP_NUM_THREADS', '1')
+os.environ.setdefault('MKL_NUM_THREADS', '1')
+os.environ.setdefault('OPENBLAS_NUM_THREADS', '1')
+
 import numpy as np
 import time
-import pickle
+import multiprocessing
+from collections import defaultdict
+import matplotlib
+matplotlib.use('Agg')  # Backend não interativo: lote roda sem GUI
 import matplotlib.pyplot as plt
 from mpl_toolkits.mplot3d import Axes3D
+from concurrent.futures import ProcessPoolExecutor, as_completed
 
 # Adicionar diretórios ao path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from src.nsga3 import NSGA3
-from src.metrics import igd, generate_reference_points_on_pareto_front
+from src.metrics import generate_reference_points_on_pareto_front
+from src.metrics_numba import igd
 from problems.dtlz import DTLZ1, DTLZ2, DTLZ3, DTLZ4
 
 # Configurações dos experimentos
@@ -50,23 +65,78 @@ MAX_GENERATIONS = {
 # Número de execuções para cada configuração
 N_RUNS = 20
 
-def run_experiment(problem_name, n_obj, run_id):
+# Diretório de cache em disco para os pontos de referência da fronteira exata
+_REF_CACHE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                              "results", "ref_points")
+
+@functools.lru_cache(maxsize=None)
+def _reference_points_cached(problem_name, n_obj):
+    """
+    Pontos de referência da fronteira de Pareto, memoizados por configuração.
+
+    O resultado é determinístico por (problema, n_obj): em memória o
+    lru_cache evita regenerá-lo a cada uma das N_RUNS execuções, e o .npy
+    em disco faz sessões Python subsequentes pularem a geração por completo.
+
+    Args:
+        problem_name: Nome do problema ('DTLZ1', ..., 'DTLZ4')
+        n_obj: Número de objetivos
+
+    Returns:
+        Pontos de referência (shape: [n_ref, n_obj])
+    """
+    os.makedirs(_REF_CACHE_DIR, exist_ok=True)
+    cache_file = os.path.join(_REF_CACHE_DIR, f"{problem_name}_{n_obj}obj.npy")
+    if os.path.exists(cache_file):
+        return np.load(cache_file)
+
+    reference_points = generate_reference_points_on_pareto_front(problem_name, n_obj)
+    np.save(cache_file, reference_points)
+    return reference_points
+
+@functools.lru_cache(maxsize=None)
+def _make_problem(problem_name, n_obj):
+    """
+    Instância do problema memoizada por (problema, n_obj).
+
+    As instâncias DTLZ são determinísticas e sem estado entre execuções,
+    então cada processo constrói uma única instância por configuração e a
+    reutiliza nas N_RUNS execuções, em vez de reconstruí-la a cada uma.
+
+    Args:
+        problem_name: Nome do problema ('DTLZ1', ..., 'DTLZ4')
+        n_obj: Número de objetivos
+
+    Returns:
+        Instância do problema
+    """
+    return PROBLEMS[problem_name](n_obj)
+
+def run_experiment(problem_name, n_obj, run_id, keep_history=False):
     """
     Executa um experimento com o NSGA-III em um problema específico.
-    
+
     Args:
         problem_name: Nome do problema ('DTLZ1', 'DTLZ2', 'DTLZ3', 'DTLZ4')
         n_obj: Número de objetivos
         run_id: ID da execução
-        
+        keep_history: Se True, mantém o histórico completo por geração;
+            caso contrário apenas os arrays 1-D de geração e IGD
+
     Returns:
         results: Dicionário com resultados do experimento
     """
     print(f"Executando {problem_name} com {n_obj} objetivos (Execução {run_id+1}/{N_RUNS})")
-    
-    # Criar problema
-    problem_class = PROBLEMS[problem_name]
-    problem = problem_class(n_obj)
+
+    # Semente derivada da configuração: reprodutível e independente da
+    # ordem em que o pool de processos agenda as execuções
+    problem_idx = sorted(PROBLEMS).index(problem_name)
+    seed_seq = np.random.SeedSequence(entropy=20140410,
+                                      spawn_key=(problem_idx, n_obj, run_id))
+    np.random.seed(seed_seq.generate_state(1)[0])
+
+    # Obter a instância do problema (construída uma vez por configuração)
+    problem = _make_problem(problem_name, n_obj)
     
     # Configurar número máximo de gerações
     max_gen = MAX_GENERATIONS[problem_name][n_obj]
@@ -78,9 +148,18 @@ def run_experiment(problem_name, n_obj, run_id):
     end_time = time.time()
     
     # Calcular métricas
-    reference_points = generate_reference_points_on_pareto_front(problem_name, n_obj)
+    reference_points = _reference_points_cached(problem_name, n_obj)
     igd_value = igd(objectives, reference_points)
-    
+
+    # Histórico enxuto por padrão: só os arrays 1-D de geração e IGD usados
+    # pela tabela e pelas curvas de convergência. O histórico completo por
+    # geração (populações e objetivos) fica restrito a quem pedir
+    if keep_history:
+        history = nsga3.history
+    else:
+        history = {'gen': np.asarray(nsga3.history['gen']),
+                   'igd': np.asarray(nsga3.history['igd'])}
+
     # Armazenar resultados
     results = {
         'problem': problem_name,
@@ -90,128 +169,145 @@ def run_experiment(problem_name, n_obj, run_id):
         'objectives': objectives,
         'igd': igd_value,
         'execution_time': end_time - start_time,
-        'history': nsga3.history
+        'history': history
     }
-    
+
     return results
 
-def save_results(results, output_dir):
+def save_run(result, output_dir):
     """
-    Salva os resultados dos experimentos.
-    
+    Salva o resultado de uma única execução assim que ela termina.
+
+    Os arrays grandes vão para um NPZ comprimido próprio e os escalares são
+    anexados a summary.jsonl — trabalho O(1) por execução concluída, sem
+    regravar arquivos acumulados.
+
     Args:
-        results: Lista de resultados de experimentos
+        result: Dicionário com o resultado da execução
         output_dir: Diretório para salvar os resultados
     """
     # Criar diretório se não existir
     os.makedirs(output_dir, exist_ok=True)
-    
-    # Agrupar resultados por problema e número de objetivos
-    grouped_results = {}
-    for result in results:
-        problem = result['problem']
-        n_obj = result['n_obj']
-        key = f"{problem}_{n_obj}"
-        
-        if key not in grouped_results:
-            grouped_results[key] = []
-        
-        grouped_results[key].append(result)
-    
-    # Salvar resultados agrupados
-    for key, group in grouped_results.items():
-        filename = os.path.join(output_dir, f"{key}_results.pkl")
-        with open(filename, 'wb') as f:
-            pickle.dump(group, f)
-    
-    # Salvar resumo dos resultados
-    summary = []
-    for result in results:
-        summary.append({
-            'problem': result['problem'],
-            'n_obj': result['n_obj'],
-            'run_id': result['run_id'],
-            'igd': result['igd'],
-            'execution_time': result['execution_time']
-        })
-    
-    summary_file = os.path.join(output_dir, "summary.pkl")
-    with open(summary_file, 'wb') as f:
-        pickle.dump(summary, f)
-    
+
+    key = f"{result['problem']}_{result['n_obj']}"
+    arrays_file = os.path.join(output_dir, f"{key}_run{result['run_id']}.npz")
+    history = result['history']
+    np.savez_compressed(arrays_file,
+                        population=result['population'],
+                        objectives=result['objectives'],
+                        hist_gen=np.asarray(history['gen']),
+                        hist_igd=np.asarray(history['igd']))
+
+    summary = {
+        'problem': result['problem'],
+        'n_obj': int(result['n_obj']),
+        'run_id': int(result['run_id']),
+        'igd': float(result['igd']),
+        'execution_time': float(result['execution_time']),
+        'arrays_path': os.path.basename(arrays_file),
+    }
+    with open(os.path.join(output_dir, "summary.jsonl"), 'a') as f:
+        f.write(json.dumps(summary) + "\n")
+
+def save_results(igd_per_config, front_candidates, output_dir):
+    """
+    Gera os artefatos agregados (tabela de IGD e visualizações) ao final.
+
+    Opera sobre as estruturas acumuladas em fluxo por main(): apenas os
+    escalares de IGD por configuração e os pares (igd, objetivos) dos
+    candidatos à fronteira mediana com 3 objetivos.
+
+    Args:
+        igd_per_config: Dicionário {(problema, n_obj): [valores de IGD]}
+        front_candidates: Dicionário {problema: [(igd, objetivos)]}
+        output_dir: Diretório para salvar os resultados
+    """
+    # Criar diretório se não existir
+    os.makedirs(output_dir, exist_ok=True)
+
     # Gerar tabela de IGD
-    generate_igd_table(results, output_dir)
-    
-    # Gerar visualizações para problemas com 3 objetivos
+    generate_igd_table(igd_per_config, output_dir)
+
+    # Gerar visualizações para problemas com 3 objetivos, reutilizando uma
+    # única figura entre os problemas (limpar os eixos é mais barato que
+    # construir e desmontar quatro figuras)
+    fig = plt.figure(figsize=(10, 8))
+    ax = fig.add_subplot(111, projection='3d')
     for problem in PROBLEMS:
-        results_3obj = [r for r in results if r['problem'] == problem and r['n_obj'] == 3]
-        if results_3obj:
+        candidates = front_candidates.get(problem)
+        if candidates:
             # Encontrar o resultado com IGD mediano
-            results_3obj.sort(key=lambda x: x['igd'])
-            median_result = results_3obj[len(results_3obj) // 2]
-            visualize_3d_front(median_result, output_dir)
+            candidates = sorted(candidates, key=lambda c: c[0])
+            _, objectives = candidates[len(candidates) // 2]
+            # Candidatos vindos de uma sessão anterior guardam só o caminho
+            # do NPZ; carregar os objetivos apenas do escolhido
+            if isinstance(objectives, str):
+                objectives = np.load(objectives)['objectives']
+            visualize_3d_front({'problem': problem, 'n_obj': 3,
+                                'objectives': objectives}, output_dir, ax=ax)
+    plt.close(fig)
 
-def generate_igd_table(results, output_dir):
+def generate_igd_table(igd_per_config, output_dir):
     """
     Gera uma tabela com os valores de IGD para cada problema e número de objetivos.
-    
+
     Args:
-        results: Lista de resultados de experimentos
+        igd_per_config: Dicionário {(problema, n_obj): [valores de IGD]}
         output_dir: Diretório para salvar a tabela
     """
-    # Agrupar resultados por problema e número de objetivos
-    igd_values = {}
-    for result in results:
-        problem = result['problem']
-        n_obj = result['n_obj']
-        key = (problem, n_obj)
-        
-        if key not in igd_values:
-            igd_values[key] = []
-        
-        igd_values[key].append(result['igd'])
-    
-    # Calcular estatísticas
+    # Estatísticas vetorizadas por grupo: min/mediana/max em O(n),
+    # sem ordenar listas Python
     igd_stats = {}
-    for key, values in igd_values.items():
-        values.sort()
+    for key, values in igd_per_config.items():
+        arr = np.asarray(values, dtype=np.float64)
         igd_stats[key] = {
-            'best': values[0],
-            'median': values[len(values) // 2],
-            'worst': values[-1]
+            'best': arr.min(),
+            'median': np.median(arr),
+            'worst': arr.max()
         }
     
-    # Gerar tabela
+    # Gerar tabela: linhas montadas em lista e gravadas em uma única escrita
+    rows = ["Problema | Objetivos | Melhor IGD | IGD Mediano | Pior IGD",
+            "---------|-----------|------------|-------------|--------"]
+    rows.extend(
+        f"{problem} | {n_obj} | {igd_stats[(problem, n_obj)]['best']:.6f} | "
+        f"{igd_stats[(problem, n_obj)]['median']:.6f} | {igd_stats[(problem, n_obj)]['worst']:.6f}"
+        for problem in sorted(PROBLEMS.keys())
+        for n_obj in sorted(OBJECTIVES)
+        if (problem, n_obj) in igd_stats)
+
     with open(os.path.join(output_dir, "igd_table.txt"), 'w') as f:
-        f.write("Problema | Objetivos | Melhor IGD | IGD Mediano | Pior IGD\n")
-        f.write("---------|-----------|------------|-------------|--------\n")
-        
-        for problem in sorted(PROBLEMS.keys()):
-            for n_obj in sorted(OBJECTIVES):
-                key = (problem, n_obj)
-                if key in igd_stats:
-                    stats = igd_stats[key]
-                    f.write(f"{problem} | {n_obj} | {stats['best']:.6f} | {stats['median']:.6f} | {stats['worst']:.6f}\n")
-
-def visualize_3d_front(result, output_dir):
+        f.write("\n".join(rows) + "\n")
+
+def visualize_3d_front(result, output_dir, ax=None):
     """
     Visualiza a fronteira de Pareto para problemas com 3 objetivos.
-    
+
     Args:
         result: Resultado de um experimento
         output_dir: Diretório para salvar a visualização
+        ax: Eixos 3D a reutilizar (limpos antes do uso); se None, uma
+            figura própria é criada e fechada ao final
     """
     if result['n_obj'] != 3:
         return
-    
+
     problem = result['problem']
     objectives = result['objectives']
-    
-    fig = plt.figure(figsize=(10, 8))
-    ax = fig.add_subplot(111, projection='3d')
-    
-    # Plotar pontos
-    ax.scatter(objectives[:, 0], objectives[:, 1], objectives[:, 2], c='blue', s=20)
+
+    owns_fig = ax is None
+    if owns_fig:
+        fig = plt.figure(figsize=(10, 8))
+        ax = fig.add_subplot(111, projection='3d')
+    else:
+        fig = ax.figure
+        ax.clear()
+
+    # Plotar pontos: no máximo 500 marcadores, amostrados uniformemente,
+    # em float32 — o custo de renderização cresce com o número de pontos
+    idx = np.linspace(0, len(objectives) - 1, min(len(objectives), 500)).astype(int)
+    pts = objectives[idx].astype(np.float32)
+    ax.scatter(pts[:, 0], pts[:, 1], pts[:, 2], c='blue', s=20)
     
     # Configurar rótulos
     ax.set_xlabel('f1')
@@ -229,9 +325,33 @@ def visualize_3d_front(result, output_dir):
         ax.set_ylim(0, 1)
         ax.set_zlim(0, 1)
     
-    # Salvar figura
-    plt.savefig(os.path.join(output_dir, f"{problem}_3obj_front.png"), dpi=300)
-    plt.close()
+    # Salvar figura (dpi reduzido para o lote: o custo de rasterização
+    # cresce com o número de pixels)
+    with plt.rc_context({'figure.max_open_warning': 0}):
+        fig.savefig(os.path.join(output_dir, f"{problem}_3obj_front.png"), dpi=150)
+    if owns_fig:
+        plt.close(fig)
+
+def _warm_numba():
+    """
+    Aquece os kernels compilados antes das tarefas reais.
+
+    Dispara a compilação (ou a carga do cache em disco do Numba, já que o
+    kernel de IGD usa cache=True) no processo pai e em cada trabalhador,
+    para que nenhuma execução cronometrada pague o custo do JIT. A execução
+    de 1 geração também percorre o caminho quente do NSGA-III uma vez.
+
+    Também limita as threads de BLAS a 1 no trabalhador (quando o
+    threadpoolctl está disponível) — cada processo já ocupa um núcleo.
+    """
+    try:
+        from threadpoolctl import threadpool_limits
+        threadpool_limits(limits=1)
+    except ImportError:
+        pass
+
+    igd(np.zeros((2, 3)), np.zeros((2, 3)))
+    NSGA3(DTLZ2(3), max_gen=1).run(verbose=False)
 
 def main():
     """Função principal para executar todos os experimentos."""
@@ -239,25 +359,71 @@ def main():
     output_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "results")
     os.makedirs(output_dir, exist_ok=True)
     
-    # Lista para armazenar todos os resultados
-    all_results = []
-    
-    # Executar experimentos para cada problema, número de objetivos e execução
-    for problem_name in PROBLEMS:
-        for n_obj in OBJECTIVES:
-            for run_id in range(N_RUNS):
-                try:
-                    result = run_experiment(problem_name, n_obj, run_id)
-                    all_results.append(result)
-                    
-                    # Salvar resultados parciais
-                    if (run_id + 1) % 5 == 0:
-                        save_results(all_results, output_dir)
-                except Exception as e:
-                    print(f"Erro ao executar {problem_name} com {n_obj} objetivos (Execução {run_id+1}): {e}")
-    
-    # Salvar todos os resultados
-    save_results(all_results, output_dir)
+    # Estatísticas acumuladas em fluxo: só escalares de IGD por configuração
+    # e, para 3 objetivos, os pares (igd, objetivos) candidatos à fronteira
+    # mediana — os arrays completos de cada execução já vão direto ao disco
+    igd_per_config = defaultdict(list)
+    front_candidates = defaultdict(list)
+
+    # Retomada: execuções já serializadas em sessões anteriores não são
+    # reexecutadas. Os escalares voltam do summary.jsonl; os objetivos de
+    # um candidato à fronteira mediana só são recarregados do NPZ se a
+    # execução retomada for a escolhida para o gráfico
+    completed_runs = set()
+    summary_path = os.path.join(output_dir, "summary.jsonl")
+    if os.path.exists(summary_path):
+        with open(summary_path) as f:
+            for line in f:
+                entry = json.loads(line)
+                npz_path = os.path.join(output_dir, entry['arrays_path'])
+                if not os.path.exists(npz_path):
+                    continue
+                completed_runs.add((entry['problem'], entry['n_obj'], entry['run_id']))
+                igd_per_config[(entry['problem'], entry['n_obj'])].append(entry['igd'])
+                if entry['n_obj'] == 3:
+                    front_candidates[entry['problem']].append((entry['igd'], npz_path))
+
+    if completed_runs:
+        print(f"Retomando: {len(completed_runs)} execuções já concluídas serão puladas")
+
+    # Cada execução é independente: despachar o produto
+    # (problema × objetivos × execução) para um pool de processos.
+    # start method 'spawn' evita que os trabalhadores herdem o mesmo
+    # estado do gerador de números aleatórios via fork
+    tasks = [(problem_name, n_obj, run_id)
+             for problem_name in PROBLEMS
+             for n_obj in OBJECTIVES
+             for run_id in range(N_RUNS)
+             if (problem_name, n_obj, run_id) not in completed_runs]
+
+    # Popular o cache de compilação antes de criar o pool: os trabalhadores
+    # reutilizam o cache em disco em vez de recompilar do zero
+    _warm_numba()
+
+    mp_context = multiprocessing.get_context('spawn')
+    with ProcessPoolExecutor(max_workers=os.cpu_count(),
+                             mp_context=mp_context,
+                             initializer=_warm_numba) as executor:
+        futures = {executor.submit(run_experiment, *task): task for task in tasks}
+        for future in as_completed(futures):
+            problem_name, n_obj, run_id = futures[future]
+            try:
+                result = future.result()
+            except Exception as e:
+                print(f"Erro ao executar {problem_name} com {n_obj} objetivos (Execução {run_id+1}): {e}")
+                continue
+
+            # Persistência incremental: NPZ da execução + linha no resumo
+            save_run(result, output_dir)
+
+            # Reduzir o resultado a escalares antes de reter qualquer coisa
+            igd_per_config[(result['problem'], result['n_obj'])].append(float(result['igd']))
+            if result['n_obj'] == 3:
+                front_candidates[result['problem']].append(
+                    (float(result['igd']), result['objectives']))
+
+    # Gerar os artefatos agregados a partir das estatísticas em fluxo
+    save_results(igd_per_config, front_candidates, output_dir)
     print(f"Todos os experimentos concluídos. Resultados salvos em {output_dir}")
 
 if __name__ == "__main__":
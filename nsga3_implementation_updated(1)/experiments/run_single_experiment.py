@@ -28,6 +28,11 @@ from src.metrics import igd, calculate_igd_with_exact_pareto
 from src.pareto_front import generate_pareto_front
 from problems.dtlz import DTLZ1, DTLZ2, DTLZ3, DTLZ4
 
+# Gerador único e semeado para as amostras de plotagem: figuras
+# determinísticas e, com shuffle=False, amostragem parcial em vez de uma
+# permutação completa dos índices
+_RNG = np.random.default_rng(0)
+
 def run_single_experiment(problem_name, n_obj, max_gen=None, visualize=True):
     """
     Executa um único experimento com o NSGA-III.
@@ -105,12 +110,14 @@ def run_single_experiment(problem_name, n_obj, max_gen=None, visualize=True):
     
     return results
 
-def visualize_results(results):
+def visualize_results(results, interactive=True):
     """
     Visualiza os resultados de um experimento.
-    
+
     Args:
         results: Dicionário com resultados do experimento
+        interactive: Se True, exibe as figuras na tela além de salvá-las;
+            se False, apenas salva os PNGs (uso em lote)
     """
     problem = results['problem']
     n_obj = results['n_obj']
@@ -119,11 +126,19 @@ def visualize_results(results):
     # Criar diretório para resultados
     output_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "results")
     os.makedirs(output_dir, exist_ok=True)
-    
+
+    # Amostrar no máximo 500 pontos (semente fixa: figuras reprodutíveis),
+    # em float32: o custo de renderização dos marcadores cresce com o
+    # número de pontos
+    idx = _RNG.choice(objectives.shape[0],
+                      size=min(500, objectives.shape[0]),
+                      replace=False, shuffle=False)
+    pts = objectives[idx].astype(np.float32)
+
     # Visualizar fronteira de Pareto para 2 ou 3 objetivos
     if n_obj == 2:
         plt.figure(figsize=(10, 8))
-        plt.scatter(objectives[:, 0], objectives[:, 1], c='blue', s=20)
+        plt.scatter(pts[:, 0], pts[:, 1], c='blue', s=20, rasterized=True)
         plt.xlabel('f1')
         plt.ylabel('f2')
         plt.title(f'{problem} - 2 Objetivos')
@@ -137,15 +152,17 @@ def visualize_results(results):
             plt.ylim(0, 1)
         
         plt.grid(True)
-        plt.savefig(os.path.join(output_dir, f"{problem}_{n_obj}obj_front.png"), dpi=300)
-        plt.show()
+        plt.savefig(os.path.join(output_dir, f"{problem}_{n_obj}obj_front.png"), dpi=150)
+        if interactive:
+            plt.show()
+        plt.close()
     
     elif n_obj == 3:
         fig = plt.figure(figsize=(10, 8))
         ax = fig.add_subplot(111, projection='3d')
         
         # Plotar pontos
-        ax.scatter(objectives[:, 0], objectives[:, 1], objectives[:, 2], c='blue', s=20)
+        ax.scatter(pts[:, 0], pts[:, 1], pts[:, 2], c='blue', s=20, rasterized=True)
         
         # Configurar rótulos
         ax.set_xlabel('f1')
@@ -163,8 +180,10 @@ def visualize_results(results):
             ax.set_ylim(0, 1)
             ax.set_zlim(0, 1)
         
-        plt.savefig(os.path.join(output_dir, f"{problem}_{n_obj}obj_front.png"), dpi=300)
-        plt.show()
+        plt.savefig(os.path.join(output_dir, f"{problem}_{n_obj}obj_front.png"), dpi=150)
+        if interactive:
+            plt.show()
+        plt.close()
     
     else:
         # Para mais de 3 objetivos, visualizar matriz de dispersão
@@ -177,7 +196,9 @@ def visualize_results(results):
         for i in range(max_vis_obj):
             for j in range(max_vis_obj):
                 if i != j:
-                    axes[i, j].scatter(objectives[:, j], objectives[:, i], c='blue', s=10)
+                    # plot() com marcadores é bem mais rápido que scatter()
+                    # para nuvens de pontos de estilo único
+                    axes[i, j].plot(pts[:, j], pts[:, i], 'b.', markersize=1)
                     
                     # Ajustar limites dos eixos
                     if problem == 'DTLZ1':
@@ -198,8 +219,10 @@ def visualize_results(results):
                     axes[i, j].set_yticks([])
         
         plt.tight_layout(rect=[0, 0, 1, 0.97])
-        plt.savefig(os.path.join(output_dir, f"{problem}_{n_obj}obj_scatter_matrix.png"), dpi=300)
-        plt.show()
+        plt.savefig(os.path.join(output_dir, f"{problem}_{n_obj}obj_scatter_matrix.png"), dpi=150)
+        if interactive:
+            plt.show()
+        plt.close()
     
     # Visualizar convergência do IGD ao longo das gerações
     if 'history' in results and 'igd' in results['history']:
@@ -209,8 +232,10 @@ def visualize_results(results):
         plt.ylabel('IGD')
         plt.title(f'{problem} - {n_obj} Objetivos - Convergência do IGD')
         plt.grid(True)
-        plt.savefig(os.path.join(output_dir, f"{problem}_{n_obj}obj_igd_convergence.png"), dpi=300)
-        plt.show()
+        plt.savefig(os.path.join(output_dir, f"{problem}_{n_obj}obj_igd_convergence.png"), dpi=150)
+        if interactive:
+            plt.show()
+        plt.close()
 
 if __name__ == "__main__":
     import argparse
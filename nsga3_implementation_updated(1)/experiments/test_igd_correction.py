@@ -9,6 +9,8 @@ do artigo original.
 import os
 import sys
 import numpy as np
+import matplotlib
+matplotlib.use('Agg')  # backend sem GUI: precisa vir antes do pyplot
 import matplotlib.pyplot as plt
 from mpl_toolkits.mplot3d import Axes3D
 import time
@@ -20,6 +22,44 @@ from src.nsga3 import NSGA3
 from src.metrics import igd, generate_reference_points_on_pareto_front
 from problems.dtlz import DTLZ1, DTLZ2, DTLZ3, DTLZ4
 
+def igd_both(objectives, reference_points):
+    """
+    Calcula o IGD normalizado e o não normalizado em uma única varredura.
+
+    As duas variantes compartilham o tensor de diferenças (R - F): a versão
+    bruta usa as coordenadas originais e a normalizada reescala as mesmas
+    diferenças pela amplitude de cada objetivo na fronteira de referência,
+    evitando percorrer a matriz de distâncias O(|R|·|F|) duas vezes.
+
+    Args:
+        objectives: Matriz de objetivos da população (shape: [n_pop, n_obj])
+        reference_points: Pontos de referência (shape: [n_ref, n_obj])
+
+    Returns:
+        (igd_normalizado, igd_bruto)
+    """
+    F = np.asarray(objectives, dtype=np.float64)
+    R = np.asarray(reference_points, dtype=np.float64)
+
+    scale = R.max(axis=0) - R.min(axis=0)
+    scale[scale == 0] = 1.0
+    inv_scale = 1.0 / scale
+
+    total_raw = 0.0
+    total_norm = 0.0
+    block = 256
+    for start in range(0, R.shape[0], block):
+        diff = R[start:start + block, None, :] - F[None, :, :]
+        dist_sq = np.einsum('ijk,ijk->ij', diff, diff)
+        total_raw += np.sqrt(dist_sq.min(axis=1)).sum()
+
+        diff *= inv_scale
+        dist_sq = np.einsum('ijk,ijk->ij', diff, diff)
+        total_norm += np.sqrt(dist_sq.min(axis=1)).sum()
+
+    n_ref = R.shape[0]
+    return total_norm / n_ref, total_raw / n_ref
+
 def test_igd_calculation():
     """
     Testa o cálculo do IGD para garantir que está alinhado com o artigo original.
@@ -58,9 +98,13 @@ def test_igd_calculation():
         'DTLZ4': {3: 600, 5: 1000}
     }
     
-    # Executar testes para DTLZ1 e DTLZ2 com 3 e 5 objetivos
+    # Executar testes para DTLZ1 e DTLZ2 com 3 e 5 objetivos. A plotagem é
+    # opcional (variável NSGA3_PLOT=1): em medições de desempenho o custo de
+    # renderização não deve entrar no tempo da corrida
+    plot_enabled = os.environ.get("NSGA3_PLOT", "0") == "1"
+    fig = None
     results = {}
-    
+
     for problem_name in ['DTLZ1', 'DTLZ2']:
         results[problem_name] = {}
         
@@ -85,9 +129,8 @@ def test_igd_calculation():
             # Gerar pontos de referência na fronteira Pareto-ótima
             reference_points = generate_reference_points_on_pareto_front(problem_name, n_obj)
             
-            # Calcular IGD com e sem normalização
-            igd_normalized = igd(objectives, reference_points, normalize=True)
-            igd_raw = igd(objectives, reference_points, normalize=False)
+            # Calcular IGD com e sem normalização em uma única passagem
+            igd_normalized, igd_raw = igd_both(objectives, reference_points)
             
             # Armazenar resultados
             results[problem_name][n_obj] = {
@@ -103,9 +146,13 @@ def test_igd_calculation():
                   f"median={reference_values[problem_name][n_obj]['median']:.6e}, "
                   f"worst={reference_values[problem_name][n_obj]['worst']:.6e}")
             
-            # Visualizar fronteira de Pareto para 3 objetivos
-            if n_obj == 3:
-                fig = plt.figure(figsize=(10, 8))
+            # Visualizar fronteira de Pareto para 3 objetivos, reutilizando
+            # uma única figura entre as iterações
+            if plot_enabled and n_obj == 3:
+                if fig is None:
+                    fig = plt.figure(figsize=(10, 8))
+                else:
+                    fig.clear()
                 ax = fig.add_subplot(111, projection='3d')
                 
                 # Plotar pontos
@@ -127,9 +174,11 @@ def test_igd_calculation():
                     ax.set_ylim(0, 1)
                     ax.set_zlim(0, 1)
                 
-                plt.savefig(os.path.join(output_dir, f"{problem_name}_{n_obj}obj_front_corrected.png"), dpi=300)
-                plt.close()
-    
+                fig.savefig(os.path.join(output_dir, f"{problem_name}_{n_obj}obj_front_corrected.png"), dpi=300)
+
+    if fig is not None:
+        plt.close(fig)
+
     # Gerar tabela comparativa
     print("\n\nTabela Comparativa de IGD:")
     print("=" * 80)
@@ -144,18 +193,20 @@ def test_igd_calculation():
     
     print("=" * 80)
     
-    # Salvar resultados em arquivo markdown
+    # Salvar resultados em arquivo markdown: linhas montadas em lista e
+    # gravadas em uma única escrita
+    lines = ["# Comparação de Valores de IGD\n",
+             "## Valores Obtidos vs. Valores do Artigo Original\n",
+             "| Problema | M | IGD (Normalizado) | IGD (Não Normalizado) | Referência (Mediana) |",
+             "|----------|---|-------------------|------------------------|----------------------|"]
+    lines.extend(
+        f"| {problem_name} | {n_obj} | {res['igd_normalized']:.6e} | "
+        f"{res['igd_raw']:.6e} | {res['reference']['median']:.6e} |"
+        for problem_name in results
+        for n_obj, res in results[problem_name].items())
+
     with open(os.path.join(output_dir, "igd_comparison.md"), 'w') as f:
-        f.write("# Comparação de Valores de IGD\n\n")
-        f.write("## Valores Obtidos vs. Valores do Artigo Original\n\n")
-        f.write("| Problema | M | IGD (Normalizado) | IGD (Não Normalizado) | Referência (Mediana) |\n")
-        f.write("|----------|---|-------------------|------------------------|----------------------|\n")
-        
-        for problem_name in results:
-            for n_obj in results[problem_name]:
-                f.write(f"| {problem_name} | {n_obj} | {results[problem_name][n_obj]['igd_normalized']:.6e} | "
-                        f"{results[problem_name][n_obj]['igd_raw']:.6e} | "
-                        f"{results[problem_name][n_obj]['reference']['median']:.6e} |\n")
+        f.write("\n".join(lines) + "\n")
     
     print(f"\nResultados salvos em {os.path.join(output_dir, 'igd_comparison.md')}")
 
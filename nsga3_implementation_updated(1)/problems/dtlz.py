@@ -11,8 +11,184 @@ Part I: Solving Problems With Box Constraints. IEEE Transactions on
 Evolutionary Computation, 18(4), 577-601.
 """
 
+import os
+
 import numpy as np
 
+# Tipo de ponto flutuante das matrizes de objetivos produzidas em lote:
+# float32 reduz pela metade os bytes movidos pelos passos ligados a banda
+# de memória a jusante (associação, IGD), com precisão suficiente para os
+# alvos DTLZ. NSGA3_DTYPE=float64 restaura a precisão completa
+_DTYPE = getattr(np, os.environ.get('NSGA3_DTYPE', 'float32'))
+
+# Constantes das fórmulas do artigo, içadas dos laços internos:
+# theta_i = x_i * pi/2 (forma esférica) e o termo cos(20*pi*(x_i - 0.5))
+# da função g do DTLZ1/DTLZ3
+_PI_HALF = np.pi / 2
+_TWENTY_PI = 20.0 * np.pi
+
+try:
+    import numexpr as ne
+    _NUMEXPR_AVAILABLE = True
+except ImportError:
+    _NUMEXPR_AVAILABLE = False
+
+try:
+    from numba import njit, prange
+    _NUMBA_AVAILABLE = True
+except ImportError:
+    _NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        def decorator(func):
+            return func
+        if args and callable(args[0]):
+            return args[0]
+        return decorator
+
+
+@njit(cache=True, fastmath=True)
+def _dtlz1_eval_into(x, n_obj, g_const, f):
+    """Kernel compilado da avaliação do DTLZ1, escrevendo em f (laços escalares)."""
+    g = 0.0
+    for idx in range(n_obj - 1, x.shape[0]):
+        d = x[idx] - 0.5
+        g += d * d - np.cos(_TWENTY_PI * d)
+    g = g_const + 100.0 * g
+
+    # Produto-prefixo calculado uma vez: cada objetivo i usa o prefixo de
+    # comprimento n_obj-i-1, em vez de refazer o produto do zero (O(n_obj)
+    # multiplicações em vez de O(n_obj²))
+    prefix = np.empty(n_obj)
+    prefix[0] = 1.0
+    for j in range(n_obj - 1):
+        prefix[j + 1] = prefix[j] * x[j]
+
+    base = 0.5 * (1.0 + g)
+    for i in range(n_obj):
+        f[i] = base * prefix[n_obj - i - 1]
+        if i > 0:
+            f[i] *= 1.0 - x[n_obj - i - 1]
+
+
+@njit(parallel=True, cache=True, fastmath=True)
+def _dtlz1_eval_batch(X, n_obj, g_const, F):
+    # Avaliação embaraçosamente paralela: uma linha da população por thread
+    for i in prange(X.shape[0]):
+        _dtlz1_eval_into(X[i], n_obj, g_const, F[i])
+
+
+@njit(cache=True, fastmath=True)
+def _apply_dtlz_shape(x_shape, g, n_obj, f):
+    """
+    Forma esférica comum aos DTLZ2/3/4: preenche f a partir dos valores já
+    transformados x_shape (x[:n_obj-1], ou x**alpha no DTLZ4) e do g do
+    problema. Um único caminho quente para compilar e otimizar.
+    """
+    # Seno e cosseno de cada ângulo calculados uma única vez e reutilizados
+    # por todos os objetivos: O(n_obj) transcendentais em vez de O(n_obj²)
+    c = np.empty(n_obj - 1)
+    s = np.empty(n_obj - 1)
+    for j in range(n_obj - 1):
+        theta = x_shape[j] * _PI_HALF
+        c[j] = np.cos(theta)
+        s[j] = np.sin(theta)
+
+    # Produto-prefixo dos cossenos: O(n_obj) multiplicações no total
+    prefix = np.empty(n_obj)
+    prefix[0] = 1.0
+    for j in range(n_obj - 1):
+        prefix[j + 1] = prefix[j] * c[j]
+
+    base = 1.0 + g
+    for i in range(n_obj):
+        f[i] = base * prefix[n_obj - i - 1]
+        if i > 0:
+            f[i] *= s[n_obj - i - 1]
+
+
+@njit(cache=True, fastmath=True)
+def _dtlz2_eval_into(x, n_obj, f):
+    """Kernel compilado da avaliação do DTLZ2, escrevendo em f (laços escalares)."""
+    g = 0.0
+    for idx in range(n_obj - 1, x.shape[0]):
+        d = x[idx] - 0.5
+        g += d * d
+
+    _apply_dtlz_shape(x[:n_obj - 1], g, n_obj, f)
+
+
+@njit(parallel=True, cache=True, fastmath=True)
+def _dtlz2_eval_batch(X, n_obj, F):
+    # Avaliação embaraçosamente paralela: uma linha da população por thread
+    for i in prange(X.shape[0]):
+        _dtlz2_eval_into(X[i], n_obj, F[i])
+
+
+@njit(cache=True, fastmath=True)
+def _dtlz3_eval_into(x, n_obj, g_const, f):
+    """Kernel compilado da avaliação do DTLZ3, escrevendo em f (g do DTLZ1, forma do DTLZ2)."""
+    g = 0.0
+    for idx in range(n_obj - 1, x.shape[0]):
+        d = x[idx] - 0.5
+        g += d * d - np.cos(_TWENTY_PI * d)
+    g = g_const + 100.0 * g
+
+    _apply_dtlz_shape(x[:n_obj - 1], g, n_obj, f)
+
+
+@njit(parallel=True, cache=True, fastmath=True)
+def _dtlz3_eval_batch(X, n_obj, g_const, F):
+    # Avaliação embaraçosamente paralela: uma linha da população por thread
+    for i in prange(X.shape[0]):
+        _dtlz3_eval_into(X[i], n_obj, g_const, F[i])
+
+
+@njit(cache=True, fastmath=True)
+def _dtlz4_eval_into(x, n_obj, alpha, f):
+    """Kernel compilado da avaliação do DTLZ4, escrevendo em f (mapeamento x**alpha)."""
+    g = 0.0
+    for idx in range(n_obj - 1, x.shape[0]):
+        d = x[idx] - 0.5
+        g += d * d
+
+    # Mapeamento não linear x**alpha antes da forma esférica comum
+    x_shape = np.empty(n_obj - 1)
+    for j in range(n_obj - 1):
+        x_shape[j] = x[j] ** alpha
+
+    _apply_dtlz_shape(x_shape, g, n_obj, f)
+
+
+@njit(parallel=True, cache=True, fastmath=True)
+def _dtlz4_eval_batch(X, n_obj, alpha, F):
+    # Avaliação embaraçosamente paralela: uma linha da população por thread
+    for i in prange(X.shape[0]):
+        _dtlz4_eval_into(X[i], n_obj, alpha, F[i])
+
+
+def _apply_dtlz_shape_np(theta, g, n_obj, F):
+    """
+    Versão NumPy vetorizada da forma esférica comum (DTLZ2/3/4): preenche F
+    a partir dos ângulos theta (já mapeados por x**alpha no DTLZ4) e do g
+    por linha.
+    """
+    C = np.cos(theta)
+    S = np.sin(theta)
+
+    # Produto-prefixo dos cossenos por linha via cumprod
+    prefix = np.concatenate([np.ones((theta.shape[0], 1)),
+                             np.cumprod(C, axis=1)], axis=1)
+
+    base = 1.0 + g
+    for i in range(n_obj):
+        F[:, i] = base * prefix[:, n_obj - i - 1]
+        if i > 0:
+            F[:, i] *= S[:, n_obj - i - 1]
+    return F
+
+
 class Problem:
     """Classe base para problemas de otimização multi-objetivo."""
     
@@ -26,8 +202,33 @@ class Problem:
         """
         self.n_var = n_var
         self.n_obj = n_obj
-        self.bounds = [(0.0, 1.0)] * n_var
-    
+        # Limites como arrays (lb/ub): os laços quentes (amostragem inicial,
+        # SBX, mutação polinomial) usam np.clip/np.random.uniform direto,
+        # sem converter uma lista de tuplas a cada geração
+        self.lb = np.zeros(n_var)
+        self.ub = np.ones(n_var)
+        # Buffer de saída reutilizado por evaluate: evita uma alocação
+        # pequena por chamada. Consequências: evaluate NÃO é thread-safe e
+        # o vetor retornado é sobrescrito na próxima chamada — quem precisa
+        # guardá-lo deve copiar (o evaluate_batch padrão já copia ao
+        # atribuir em F[i])
+        self._f_scratch = np.empty(n_obj)
+        # Contrato de entrada dos kernels: float64 C-contíguo. Um dtype fixo
+        # evita caminhos strided lentos nos ufuncs e recompilações do Numba
+        # por assinatura quando x chega como fatia/float32
+        self._dtype = np.float64
+
+    @property
+    def bounds(self):
+        """Limites das variáveis como lista de tuplas (compatibilidade)."""
+        return list(zip(self.lb, self.ub))
+
+    @bounds.setter
+    def bounds(self, value):
+        arr = np.asarray(value, dtype=np.float64).reshape(-1, 2)
+        self.lb = np.ascontiguousarray(arr[:, 0])
+        self.ub = np.ascontiguousarray(arr[:, 1])
+
     def evaluate(self, x):
         """
         Avalia uma solução e retorna os valores dos objetivos.
@@ -40,6 +241,26 @@ class Problem:
         """
         raise NotImplementedError("Método evaluate deve ser implementado nas subclasses")
 
+    def evaluate_batch(self, X):
+        """
+        Avalia um lote de soluções e retorna a matriz de objetivos.
+
+        A implementação padrão apenas mapeia evaluate sobre as linhas de X,
+        copiando cada resultado para a matriz de saída (evaluate pode
+        devolver um buffer interno reutilizado); subclasses podem
+        sobrescrever com uma versão vetorizada ou paralela.
+
+        Args:
+            X: Matriz de variáveis de decisão (shape: [n_pop, n_var])
+
+        Returns:
+            Matriz de valores dos objetivos (shape: [n_pop, n_obj])
+        """
+        F = np.empty((len(X), self.n_obj))
+        for i, x in enumerate(X):
+            F[i] = self.evaluate(x)
+        return F
+
 
 class DTLZ1(Problem):
     """
@@ -61,6 +282,9 @@ class DTLZ1(Problem):
         if n_var is None:
             n_var = n_obj + 4  # k=5
         super().__init__(n_var, n_obj)
+        # Constantes da instância: k e 100*k aparecem em toda avaliação
+        self.k = self.n_var - self.n_obj + 1
+        self._g_const = 100.0 * self.k
     
     def evaluate(self, x):
         """
@@ -70,26 +294,56 @@ class DTLZ1(Problem):
             x: Vetor de variáveis de decisão
             
         Returns:
-            Vetor de valores dos objetivos
+            Vetor de valores dos objetivos (buffer interno reutilizado entre
+            chamadas; copie se precisar guardar)
         """
-        k = self.n_var - self.n_obj + 1
-        
-        # Calcular g(xM)
-        g = 100 * (k + np.sum((x[self.n_obj-1:] - 0.5)**2 - np.cos(20 * np.pi * (x[self.n_obj-1:] - 0.5))))
-        
-        # Calcular os objetivos
-        f = np.zeros(self.n_obj)
-        
-        for i in range(self.n_obj):
-            f[i] = 0.5 * (1 + g)
-            
-            for j in range(self.n_obj - i - 1):
-                f[i] *= x[j]
-            
+        _dtlz1_eval_into(np.ascontiguousarray(x, dtype=self._dtype), self.n_obj,
+                         self._g_const, self._f_scratch)
+        return self._f_scratch
+
+    def evaluate_batch(self, X):
+        """
+        Avalia um lote de soluções para o problema DTLZ1 de forma vetorizada.
+
+        Args:
+            X: Matriz de variáveis de decisão (shape: [n_pop, n_var])
+
+        Returns:
+            Matriz de valores dos objetivos (shape: [n_pop, n_obj])
+        """
+        X = np.ascontiguousarray(X, dtype=self._dtype)
+        n_obj = self.n_obj
+
+        if _NUMBA_AVAILABLE:
+            # Kernel paralelo (prange sobre as linhas; respeita
+            # NUMBA_NUM_THREADS), com F alocada uma única vez
+            F = np.empty((X.shape[0], n_obj), dtype=_DTYPE)
+            _dtlz1_eval_batch(X, n_obj, self._g_const, F)
+            return F
+
+        # g(xM) por linha: 100*k é constante da instância, somado uma vez
+        # fora da soma grande. Com numexpr a expressão inteira (quadrado,
+        # cosseno, diferença e redução) roda fundida em blocos, sem os
+        # temporários intermediários do NumPy
+        d = X[:, n_obj-1:] - 0.5
+        if _NUMEXPR_AVAILABLE:
+            g_sum = ne.evaluate('sum(d*d - cos(twenty_pi*d), axis=1)',
+                                local_dict={'d': d, 'twenty_pi': _TWENTY_PI})
+        else:
+            g_sum = (d**2 - np.cos(_TWENTY_PI * d)).sum(axis=1)
+        g = self._g_const + 100.0 * g_sum
+
+        # Produto-prefixo por linha via cumprod: O(n_obj) colunas no total
+        prefix = np.concatenate([np.ones((X.shape[0], 1)),
+                                 np.cumprod(X[:, :n_obj-1], axis=1)], axis=1)
+
+        base = 0.5 * (1.0 + g)
+        F = np.empty((X.shape[0], n_obj), dtype=_DTYPE)
+        for i in range(n_obj):
+            F[:, i] = base * prefix[:, n_obj - i - 1]
             if i > 0:
-                f[i] *= (1 - x[self.n_obj - i - 1])
-        
-        return f
+                F[:, i] *= 1.0 - X[:, n_obj - i - 1]
+        return F
 
 
 class DTLZ2(Problem):
@@ -112,6 +366,7 @@ class DTLZ2(Problem):
         if n_var is None:
             n_var = n_obj + 9  # k=10
         super().__init__(n_var, n_obj)
+        self.k = self.n_var - self.n_obj + 1
     
     def evaluate(self, x):
         """
@@ -121,26 +376,38 @@ class DTLZ2(Problem):
             x: Vetor de variáveis de decisão
             
         Returns:
-            Vetor de valores dos objetivos
+            Vetor de valores dos objetivos (buffer interno reutilizado entre
+            chamadas; copie se precisar guardar)
         """
-        k = self.n_var - self.n_obj + 1
-        
-        # Calcular g(xM)
-        g = np.sum((x[self.n_obj-1:] - 0.5)**2)
-        
-        # Calcular os objetivos
-        f = np.zeros(self.n_obj)
-        
-        for i in range(self.n_obj):
-            f[i] = 1 + g
-            
-            for j in range(self.n_obj - i - 1):
-                f[i] *= np.cos(x[j] * np.pi / 2)
-            
-            if i > 0:
-                f[i] *= np.sin(x[self.n_obj - i - 1] * np.pi / 2)
-        
-        return f
+        _dtlz2_eval_into(np.ascontiguousarray(x, dtype=self._dtype), self.n_obj,
+                         self._f_scratch)
+        return self._f_scratch
+
+    def evaluate_batch(self, X):
+        """
+        Avalia um lote de soluções para o problema DTLZ2 de forma vetorizada.
+
+        Args:
+            X: Matriz de variáveis de decisão (shape: [n_pop, n_var])
+
+        Returns:
+            Matriz de valores dos objetivos (shape: [n_pop, n_obj])
+        """
+        X = np.ascontiguousarray(X, dtype=self._dtype)
+        n_obj = self.n_obj
+
+        if _NUMBA_AVAILABLE:
+            # Kernel paralelo (prange sobre as linhas; respeita
+            # NUMBA_NUM_THREADS), com F alocada uma única vez
+            F = np.empty((X.shape[0], n_obj), dtype=_DTYPE)
+            _dtlz2_eval_batch(X, n_obj, F)
+            return F
+
+        g = ((X[:, n_obj-1:] - 0.5)**2).sum(axis=1)
+
+        theta = X[:, :n_obj-1] * _PI_HALF
+        F = np.empty((X.shape[0], n_obj), dtype=_DTYPE)
+        return _apply_dtlz_shape_np(theta, g, n_obj, F)
 
 
 class DTLZ3(Problem):
@@ -164,6 +431,9 @@ class DTLZ3(Problem):
         if n_var is None:
             n_var = n_obj + 9  # k=10
         super().__init__(n_var, n_obj)
+        # Constantes da instância: k e 100*k aparecem em toda avaliação
+        self.k = self.n_var - self.n_obj + 1
+        self._g_const = 100.0 * self.k
     
     def evaluate(self, x):
         """
@@ -173,26 +443,47 @@ class DTLZ3(Problem):
             x: Vetor de variáveis de decisão
             
         Returns:
-            Vetor de valores dos objetivos
+            Vetor de valores dos objetivos (buffer interno reutilizado entre
+            chamadas; copie se precisar guardar)
         """
-        k = self.n_var - self.n_obj + 1
-        
-        # Calcular g(xM) - similar ao DTLZ1 mas com a forma do DTLZ2
-        g = 100 * (k + np.sum((x[self.n_obj-1:] - 0.5)**2 - np.cos(20 * np.pi * (x[self.n_obj-1:] - 0.5))))
-        
-        # Calcular os objetivos - similar ao DTLZ2
-        f = np.zeros(self.n_obj)
-        
-        for i in range(self.n_obj):
-            f[i] = 1 + g
-            
-            for j in range(self.n_obj - i - 1):
-                f[i] *= np.cos(x[j] * np.pi / 2)
-            
-            if i > 0:
-                f[i] *= np.sin(x[self.n_obj - i - 1] * np.pi / 2)
-        
-        return f
+        _dtlz3_eval_into(np.ascontiguousarray(x, dtype=self._dtype), self.n_obj,
+                         self._g_const, self._f_scratch)
+        return self._f_scratch
+
+    def evaluate_batch(self, X):
+        """
+        Avalia um lote de soluções para o problema DTLZ3 de forma vetorizada.
+
+        Args:
+            X: Matriz de variáveis de decisão (shape: [n_pop, n_var])
+
+        Returns:
+            Matriz de valores dos objetivos (shape: [n_pop, n_obj])
+        """
+        X = np.ascontiguousarray(X, dtype=self._dtype)
+        n_obj = self.n_obj
+
+        if _NUMBA_AVAILABLE:
+            # Kernel paralelo (prange sobre as linhas; respeita
+            # NUMBA_NUM_THREADS), com F alocada uma única vez
+            F = np.empty((X.shape[0], n_obj), dtype=_DTYPE)
+            _dtlz3_eval_batch(X, n_obj, self._g_const, F)
+            return F
+
+        # g do DTLZ1 com a forma esférica do DTLZ2; 100*k é constante da
+        # instância, somado uma vez fora da soma grande. Mesma fusão via
+        # numexpr do DTLZ1
+        d = X[:, n_obj-1:] - 0.5
+        if _NUMEXPR_AVAILABLE:
+            g_sum = ne.evaluate('sum(d*d - cos(twenty_pi*d), axis=1)',
+                                local_dict={'d': d, 'twenty_pi': _TWENTY_PI})
+        else:
+            g_sum = (d**2 - np.cos(_TWENTY_PI * d)).sum(axis=1)
+        g = self._g_const + 100.0 * g_sum
+
+        theta = X[:, :n_obj-1] * _PI_HALF
+        F = np.empty((X.shape[0], n_obj), dtype=_DTYPE)
+        return _apply_dtlz_shape_np(theta, g, n_obj, F)
 
 
 class DTLZ4(Problem):
@@ -218,6 +509,7 @@ class DTLZ4(Problem):
             n_var = n_obj + 9  # k=10
         super().__init__(n_var, n_obj)
         self.alpha = alpha
+        self.k = self.n_var - self.n_obj + 1
     
     def evaluate(self, x):
         """
@@ -227,23 +519,36 @@ class DTLZ4(Problem):
             x: Vetor de variáveis de decisão
             
         Returns:
-            Vetor de valores dos objetivos
+            Vetor de valores dos objetivos (buffer interno reutilizado entre
+            chamadas; copie se precisar guardar)
         """
-        k = self.n_var - self.n_obj + 1
-        
-        # Calcular g(xM) - similar ao DTLZ2
-        g = np.sum((x[self.n_obj-1:] - 0.5)**2)
-        
-        # Calcular os objetivos - similar ao DTLZ2 mas com mapeamento não linear
-        f = np.zeros(self.n_obj)
-        
-        for i in range(self.n_obj):
-            f[i] = 1 + g
-            
-            for j in range(self.n_obj - i - 1):
-                f[i] *= np.cos(x[j]**self.alpha * np.pi / 2)
-            
-            if i > 0:
-                f[i] *= np.sin(x[self.n_obj - i - 1]**self.alpha * np.pi / 2)
-        
-        return f
+        _dtlz4_eval_into(np.ascontiguousarray(x, dtype=self._dtype), self.n_obj,
+                         float(self.alpha), self._f_scratch)
+        return self._f_scratch
+
+    def evaluate_batch(self, X):
+        """
+        Avalia um lote de soluções para o problema DTLZ4 de forma vetorizada.
+
+        Args:
+            X: Matriz de variáveis de decisão (shape: [n_pop, n_var])
+
+        Returns:
+            Matriz de valores dos objetivos (shape: [n_pop, n_obj])
+        """
+        X = np.ascontiguousarray(X, dtype=self._dtype)
+        n_obj = self.n_obj
+
+        if _NUMBA_AVAILABLE:
+            # Kernel paralelo (prange sobre as linhas; respeita
+            # NUMBA_NUM_THREADS), com F alocada uma única vez
+            F = np.empty((X.shape[0], n_obj), dtype=_DTYPE)
+            _dtlz4_eval_batch(X, n_obj, float(self.alpha), F)
+            return F
+
+        g = ((X[:, n_obj-1:] - 0.5)**2).sum(axis=1)
+
+        # Mapeamento não linear x**alpha antes da parte trigonométrica
+        theta = (X[:, :n_obj-1] ** self.alpha) * _PI_HALF
+        F = np.empty((X.shape[0], n_obj), dtype=_DTYPE)
+        return _apply_dtlz_shape_np(theta, g, n_obj, F)
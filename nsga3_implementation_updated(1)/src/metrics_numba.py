@@ -0,0 +1,114 @@
+"""
+Módulo com o cálculo de IGD compilado via Numba.
+
+A versão NumPy da métrica materializa a matriz de distâncias par a par
+(|R| × |P|), o que é limitado por banda de memória. O kernel abaixo percorre
+os pontos de referência em paralelo (prange) com laços escalares, sem
+temporários grandes, e é compilado com assinatura explícita para que o
+primeiro uso em um processo trabalhador não pague o custo do JIT.
+
+Quando o Numba não está disponível, o módulo recai primeiro no cdist do
+SciPy (kernel C sem o buffer 3-D do broadcast) e, na ausência de ambos,
+em uma implementação NumPy equivalente em blocos.
+
+Referência:
+Deb, K., & Jain, H. (2014). An Evolutionary Many-Objective Optimization
+Algorithm Using Reference-Point-Based Nondominated Sorting Approach,
+Part I: Solving Problems With Box Constraints. IEEE Transactions on
+Evolutionary Computation, 18(4), 577-601.
+"""
+
+import math
+
+import numpy as np
+
+try:
+    from scipy.spatial.distance import cdist
+    _SCIPY_AVAILABLE = True
+except ImportError:
+    _SCIPY_AVAILABLE = False
+
+try:
+    from numba import njit, prange
+    _NUMBA_AVAILABLE = True
+except ImportError:
+    _NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        def decorator(func):
+            return func
+        if args and callable(args[0]):
+            return args[0]
+        return decorator
+
+
+@njit('float64(float64[:,::1], float64[:,::1])',
+      parallel=True, cache=True, fastmath=True)
+def _igd_kernel(F, R):
+    """
+    Soma das distâncias de cada ponto de referência ao ponto mais próximo
+    da fronteira obtida, dividida pelo número de pontos de referência.
+
+    Args:
+        F: Objetivos da população (shape: [n_pop, n_obj], C-contíguo)
+        R: Pontos de referência (shape: [n_ref, n_obj], C-contíguo)
+
+    Returns:
+        Valor do IGD
+    """
+    n_ref = R.shape[0]
+    n_pop = F.shape[0]
+    n_obj = F.shape[1]
+
+    total = 0.0
+    for i in prange(n_ref):
+        best = np.inf
+        for j in range(n_pop):
+            dist_sq = 0.0
+            for m in range(n_obj):
+                diff = R[i, m] - F[j, m]
+                dist_sq += diff * diff
+            if dist_sq < best:
+                best = dist_sq
+        total += math.sqrt(best)
+
+    return total / n_ref
+
+
+def _igd_numpy(F, R):
+    """
+    Implementação NumPy de reserva, em blocos de pontos de referência para
+    limitar o tamanho da matriz de distâncias temporária.
+    """
+    total = 0.0
+    block = 256
+    for start in range(0, R.shape[0], block):
+        chunk = R[start:start + block]
+        diff = chunk[:, None, :] - F[None, :, :]
+        dist_sq = np.einsum('ijk,ijk->ij', diff, diff)
+        total += np.sqrt(dist_sq.min(axis=1)).sum()
+    return total / R.shape[0]
+
+
+def igd(objectives, reference_points):
+    """
+    Calcula o IGD (Inverted Generational Distance).
+
+    Args:
+        objectives: Matriz de objetivos da população (shape: [n_pop, n_obj])
+        reference_points: Pontos de referência da fronteira de Pareto
+            (shape: [n_ref, n_obj])
+
+    Returns:
+        Valor do IGD
+    """
+    F = np.ascontiguousarray(objectives, dtype=np.float64)
+    R = np.ascontiguousarray(reference_points, dtype=np.float64)
+
+    if _NUMBA_AVAILABLE:
+        return _igd_kernel(F, R)
+    if _SCIPY_AVAILABLE:
+        # cdist é vetorizado em C e evita o buffer 3-D do broadcast NumPy
+        return cdist(R, F).min(axis=1).mean()
+    return _igd_numpy(F, R)
@@ -0,0 +1,56 @@
+"""
+Módulo de ordenação não-dominada vetorizada para o NSGA-III.
+
+Este módulo implementa o cálculo dos rankings de Pareto de uma população
+inteira com uma única comparação por broadcasting, substituindo o teste
+de dominância par a par O(N²) em Python puro.
+
+Referência:
+Deb, K., & Jain, H. (2014). An Evolutionary Many-Objective Optimization
+Algorithm Using Reference-Point-Based Nondominated Sorting Approach,
+Part I: Solving Problems With Box Constraints. IEEE Transactions on
+Evolutionary Computation, 18(4), 577-601.
+"""
+
+import numpy as np
+
+def compute_pareto_ranks(objectives):
+    """
+    Calcula o ranking de Pareto (índice da frente) de cada indivíduo.
+
+    A matriz de dominância completa é construída com um único broadcast
+    booleano (N, N, M) e as frentes são descascadas iterativamente, em vez
+    de comparar cada par de indivíduos em laços Python.
+
+    Args:
+        objectives: Matriz de objetivos (shape: [n_pop, n_obj]), minimização
+
+    Returns:
+        ranks: Array de inteiros com a frente de cada indivíduo (0 = não-dominado)
+    """
+    # float32 reduz pela metade o temporário (N, N, M) do broadcast
+    F = np.asarray(objectives, dtype=np.float32)
+    n_pop = F.shape[0]
+
+    # dom[i, j] = True se o indivíduo i domina o indivíduo j
+    dom = (F[:, None, :] <= F[None, :, :]).all(axis=-1) & \
+          (F[:, None, :] < F[None, :, :]).any(axis=-1)
+
+    ranks = np.empty(n_pop, dtype=np.int64)
+    remaining = np.arange(n_pop)
+    rank = 0
+
+    while remaining.size > 0:
+        # Frente atual: indivíduos sem dominadores entre os remanescentes
+        sub = dom[np.ix_(remaining, remaining)]
+        front = sub.sum(axis=0) == 0
+
+        if not front.any():
+            # Segurança numérica: nunca deve ocorrer com dominância estrita
+            front[:] = True
+
+        ranks[remaining[front]] = rank
+        remaining = remaining[~front]
+        rank += 1
+
+    return ranks